@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 
 from ai_arena.game import PlayerId, Terminal
@@ -106,15 +107,8 @@ class CodexGame:
         if w[player][0] is not None or w[player][1] is not None:
             return []
 
-        taken = _occupied_positions(w)
-        empties = [i for i in range(self.board_size * self.board_size) if i not in taken]
-        moves: list[JSONValue] = []
-        for idx_a, a in enumerate(empties):
-            for b in empties[idx_a + 1 :]:
-                # Allow either ordering to avoid "unordered pair" footguns for agents.
-                moves.append({"t": "place", "to": [a, b]})
-                moves.append({"t": "place", "to": [b, a]})
-        return moves
+        pairs = _place_pairs(self.board_size * self.board_size, frozenset(_occupied_positions(w)))
+        return [{"t": "place", "to": [a, b]} for a, b in pairs]
 
     def _apply_place(self, s: dict[str, JSONValue], player: PlayerId, move: JSONValue) -> JSONValue:
         if not isinstance(move, dict) or move.get("t") != "place":
@@ -146,7 +140,7 @@ class CodexGame:
         return {
             "phase": phase,
             "ply": int(s["ply"]) + 1,
-            "board": list(_as_board(s["board"])),
+            "board": _as_board(s["board"]),  # already a fresh copy
             "workers": w2,
             "winner": None,
             "reason": "",
@@ -161,12 +155,13 @@ class CodexGame:
             # Not ready (shouldn't happen if phase is correct), but avoid crashes.
             return []
 
+        n = self.board_size
         occ_now = _occupied_positions(w)
         moves: list[JSONValue] = []
         for wi in (0, 1):
             src = int(w[player][wi])  # type: ignore[arg-type]
             src_h = b[src]
-            for dst in _neighbors(self.board_size, src):
+            for dst in _neighbors(n, src):
                 if dst in occ_now:
                     continue
                 dst_h = b[dst]
@@ -180,15 +175,10 @@ class CodexGame:
                     moves.append({"t": "move", "w": wi, "to": dst, "build": None})
                     continue
 
-                # Otherwise: must build adjacent to the moved worker.
-                occ_after = set(occ_now)
-                occ_after.remove(src)
-                occ_after.add(dst)
-
-                for build in _neighbors(self.board_size, dst):
-                    if build in occ_after:
-                        continue
-                    if b[build] >= 4:
+                # Otherwise: must build adjacent to the moved worker. The cell it
+                # left is free again; dst itself is never its own neighbour.
+                for build in _neighbors(n, dst):
+                    if (build in occ_now and build != src) or b[build] >= 4:
                         continue
                     moves.append({"t": "move", "w": wi, "to": dst, "build": build})
         return moves
@@ -207,7 +197,7 @@ class CodexGame:
         if build is not None and not isinstance(build, int):
             raise ValueError(f"move.build must be int or None, got: {build!r}")
 
-        b = list(_as_board(s["board"]))
+        b = _as_board(s["board"])  # fresh copy; the build below mutates it
         w = _as_workers(s["workers"])
         if any(not isinstance(w[pid][wi], int) for pid in (0, 1) for wi in (0, 1)):
             raise ValueError("cannot move before both players have placed")
@@ -279,6 +269,7 @@ def _as_state(state: JSONValue) -> dict[str, JSONValue]:
 
 
 def _as_board(board: JSONValue) -> list[int]:
+    """Validated copy of the board (callers may mutate it)."""
     if not isinstance(board, list) or not all(isinstance(x, int) for x in board):
         raise ValueError("state.board must be list[int]")
     return [int(x) for x in board]
@@ -303,6 +294,25 @@ def _as_workers(workers: JSONValue) -> list[list[int | None]]:
     return out
 
 
+@functools.lru_cache(maxsize=512)
+def _place_pairs(cells: int, taken: frozenset[int]) -> tuple[tuple[int, int], ...]:
+    """
+    Ordered (a, b) placement pairs on the free cells, built once per occupancy.
+
+    There are only a few hundred occupancies (empty board, or P0's two workers
+    placed). Only immutable pairs are cached; legal_moves builds fresh move
+    dicts from them, since agents may mutate the moves they are given.
+    """
+    empties = [i for i in range(cells) if i not in taken]
+    pairs: list[tuple[int, int]] = []
+    for idx_a, a in enumerate(empties):
+        for b in empties[idx_a + 1 :]:
+            # Allow either ordering to avoid "unordered pair" footguns for agents.
+            pairs.append((a, b))
+            pairs.append((b, a))
+    return tuple(pairs)
+
+
 def _occupied_positions(workers: list[list[int | None]]) -> set[int]:
     out: set[int] = set()
     for p in workers:
@@ -312,7 +322,9 @@ def _occupied_positions(workers: list[list[int | None]]) -> set[int]:
     return out
 
 
-def _neighbors(n: int, idx: int) -> list[int]:
+@functools.cache
+def _neighbors(n: int, idx: int) -> tuple[int, ...]:
+    """The up-to-8 cells around idx on an n x n board; computed once per cell."""
     r, c = divmod(idx, n)
     out: list[int] = []
     for dr in (-1, 0, 1):
@@ -323,7 +335,7 @@ def _neighbors(n: int, idx: int) -> list[int]:
             cc = c + dc
             if 0 <= rr < n and 0 <= cc < n:
                 out.append(rr * n + cc)
-    return out
+    return tuple(out)
 
 
 def _winner_on_turn_limit(s: dict[str, JSONValue]) -> PlayerId | None:
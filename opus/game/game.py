@@ -78,7 +78,7 @@ class OpusGame:
         opp_pieces: list[dict] = state[f"p{1 - player}"]
 
         friendly = {(p["r"], p["c"]) for p in my_pieces}
-        enemy = {(p["r"], p["c"]) for p in opp_pieces}
+        occupied = friendly | {(p["r"], p["c"]) for p in opp_pieces}
 
         moves: list[JSONValue] = []
 
@@ -91,30 +91,27 @@ class OpusGame:
                 _add_step_moves(moves, board, friendly, pr, pc)
 
             elif ptype == LANCER:
-                # 1-step and 2-step straight-line moves
-                for dr, dc in DIRS_8:
+                # 1-step and 2-step straight-line moves; both need the first
+                # cell passable and climbable.
+                here = board[pr][pc]
+                for r1, c1, leap in _LANCER_RAYS[pr * SIZE + pc]:
+                    h1 = board[r1][c1]
+                    if h1 == VENT or h1 > here + 1:
+                        continue
                     # --- 1 step ---
-                    r1, c1 = pr + dr, pc + dc
-                    if _in_bounds(r1, c1) and board[r1][c1] != VENT \
-                            and (r1, c1) not in friendly \
-                            and _can_climb(board[pr][pc], board[r1][c1]):
+                    if (r1, c1) not in friendly:
                         moves.append({"action": "move", "from": [pr, pc], "to": [r1, c1]})
-
                     # --- 2 steps (leap) ---
-                    r2, c2 = pr + 2 * dr, pc + 2 * dc
-                    if _in_bounds(r1, c1) and _in_bounds(r2, c2) \
-                            and board[r1][c1] != VENT and board[r2][c2] != VENT \
-                            and (r2, c2) not in friendly \
-                            and _can_climb(board[pr][pc], board[r1][c1]) \
-                            and _can_climb(board[r1][c1], board[r2][c2]):
-                        moves.append({"action": "move", "from": [pr, pc], "to": [r2, c2]})
+                    if leap is not None:
+                        r2, c2 = leap
+                        h2 = board[r2][c2]
+                        if h2 != VENT and h2 <= h1 + 1 and leap not in friendly:
+                            moves.append({"action": "move", "from": [pr, pc], "to": [r2, c2]})
 
             # --- forge (smiths only) ---
             if ptype == SMITH:
-                for dr, dc in DIRS_4:
-                    tr, tc = pr + dr, pc + dc
-                    if _in_bounds(tr, tc) and board[tr][tc] != VENT \
-                            and (tr, tc) not in friendly and (tr, tc) not in enemy:
+                for tr, tc in _STEPS_4[pr * SIZE + pc]:
+                    if board[tr][tc] != VENT and (tr, tc) not in occupied:
                         moves.append({"action": "forge", "smith": [pr, pc], "target": [tr, tc]})
 
         return moves
@@ -238,9 +235,28 @@ def _in_bounds(r: int, c: int) -> bool:
     return 0 <= r < SIZE and 0 <= c < SIZE
 
 
-def _can_climb(from_h: int, to_h: int) -> bool:
-    """Ascending at most 1 level; descending any amount."""
-    return to_h <= from_h + 1
+# On-board neighbour tables indexed by r * SIZE + c, in DIRS_8 / DIRS_4 order,
+# so move generation never re-checks bounds.
+_STEPS_8: tuple[tuple[tuple[int, int], ...], ...] = tuple(
+    tuple((r + dr, c + dc) for dr, dc in DIRS_8 if _in_bounds(r + dr, c + dc))
+    for r in range(SIZE)
+    for c in range(SIZE)
+)
+_STEPS_4: tuple[tuple[tuple[int, int], ...], ...] = tuple(
+    tuple((r + dr, c + dc) for dr, dc in DIRS_4 if _in_bounds(r + dr, c + dc))
+    for r in range(SIZE)
+    for c in range(SIZE)
+)
+# Lancer rays: (r1, c1, leap cell or None) for each DIRS_8 direction whose first step is on board.
+_LANCER_RAYS: tuple[tuple[tuple[int, int, tuple[int, int] | None], ...], ...] = tuple(
+    tuple(
+        (r + dr, c + dc, (r + 2 * dr, c + 2 * dc) if _in_bounds(r + 2 * dr, c + 2 * dc) else None)
+        for dr, dc in DIRS_8
+        if _in_bounds(r + dr, c + dc)
+    )
+    for r in range(SIZE)
+    for c in range(SIZE)
+)
 
 
 def _add_step_moves(
@@ -251,11 +267,11 @@ def _add_step_moves(
     pc: int,
 ) -> None:
     """Append single-step moves (8-dir) for Crown / Smith."""
-    for dr, dc in DIRS_8:
-        tr, tc = pr + dr, pc + dc
-        if _in_bounds(tr, tc) and board[tr][tc] != VENT \
-                and (tr, tc) not in friendly \
-                and _can_climb(board[pr][pc], board[tr][tc]):
+    here = board[pr][pc]
+    # Climbing: ascend at most 1 level, descend any amount.
+    for tr, tc in _STEPS_8[pr * SIZE + pc]:
+        h = board[tr][tc]
+        if h != VENT and h <= here + 1 and (tr, tc) not in friendly:
             moves.append({"action": "move", "from": [pr, pc], "to": [tr, tc]})
 
 
@@ -272,10 +288,12 @@ def _resolve_eruptions(
 
     # Seed: every cell currently >= 4
     for r in range(SIZE):
+        row = board[r]
         for c in range(SIZE):
-            if board[r][c] >= 4:
+            if row[c] >= 4:
                 queue.append((r, c))
 
+    erupted: set[tuple[int, int]] = set()
     while queue:
         er, ec = queue.popleft()
         if board[er][ec] == VENT:
@@ -285,19 +303,22 @@ def _resolve_eruptions(
 
         # Erupt this cell
         board[er][ec] = VENT
-
-        # Destroy any piece here
-        for pieces in (p0, p1):
-            pieces[:] = [p for p in pieces if not (p["r"] == er and p["c"] == ec)]
+        erupted.add((er, ec))
 
         # Raise orthogonal neighbours
-        for dr, dc in DIRS_4:
-            nr, nc = er + dr, ec + dc
-            if _in_bounds(nr, nc) and board[nr][nc] != VENT:
-                board[nr][nc] += 1
-                if board[nr][nc] >= 4:
+        for nr, nc in _STEPS_4[er * SIZE + ec]:
+            h = board[nr][nc]
+            if h != VENT:
+                board[nr][nc] = h + 1
+                if h + 1 >= 4:
                     queue.append((nr, nc))
 
+    # Pieces never move during a chain, so destroy everything standing on a
+    # new vent in one pass per side.
+    if erupted:
+        for pieces in (p0, p1):
+            pieces[:] = [p for p in pieces if (p["r"], p["c"]) not in erupted]
+
 
 def _winner_on_limit(state: JSONValue) -> tuple[int | None, str]:
     """Determine winner when ply limit reached."""
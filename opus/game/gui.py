@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import json
+import queue
 import random as _random
 import threading
 import tkinter as tk
+from collections import deque
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, NamedTuple
 
 from opus.game.game import OpusGame, SIZE, VENT, CROWN, LANCER, SMITH
 
@@ -17,6 +19,18 @@ from opus.game.game import OpusGame, SIZE, VENT, CROWN, LANCER, SMITH
 
 CELL_PX = 72
 BOARD_PX = CELL_PX * SIZE
+PIECE_RADIUS = CELL_PX // 2 - 10
+HISTORY_ROWS = 500  # most recent moves kept in the history panel
+
+# Pixel geometry per cell, indexed [r][c]; the board size never changes
+CELL_BBOX = tuple(
+    tuple((c * CELL_PX, r * CELL_PX, (c + 1) * CELL_PX, (r + 1) * CELL_PX) for c in range(SIZE))
+    for r in range(SIZE)
+)
+CELL_CENTER = tuple(
+    tuple((c * CELL_PX + CELL_PX // 2, r * CELL_PX + CELL_PX // 2) for c in range(SIZE))
+    for r in range(SIZE)
+)
 
 # Terrain colours keyed by height
 TERRAIN_COLORS = {
@@ -38,10 +52,72 @@ MOVE_COLOR = "#22c55e"   # move destination (green)
 FORGE_COLOR = "#f97316"  # forge target (orange)
 CAP_COLOR = "#ef4444"    # capturable enemy (red)
 
+# Overlay codes, lowest wins when a cell has several: index into OVERLAY_OUTLINE
+OV_NONE, OV_SEL, OV_CAP, OV_FORGE, OV_MOVE = range(5)
+OVERLAY_OUTLINE = (None, SEL_COLOR, CAP_COLOR, FORGE_COLOR, MOVE_COLOR)
+
+AI_POLL_MS = 16  # how often the Tk loop drains finished AI moves
+
 # Piece type → single letter
 TYPE_LETTER = {CROWN: "C", LANCER: "L", SMITH: "S"}
 
 
+# ---------------------------------------------------------------------------
+# Piece index
+# ---------------------------------------------------------------------------
+
+class Piece(NamedTuple):
+    """Read-only view of a piece record (state pieces stay plain dicts)."""
+
+    player: int
+    type: str
+    r: int
+    c: int
+
+
+def _bit(r: int, c: int) -> int:
+    return 1 << (r * SIZE + c)
+
+
+def _player_masks(pieces: dict[tuple[int, int], Piece]) -> tuple[int, int]:
+    """Per-player occupancy bitboards (bit r*SIZE+c set when occupied)."""
+    masks = [0, 0]
+    for p in pieces.values():
+        masks[p.player] |= _bit(p.r, p.c)
+    return masks[0], masks[1]
+
+
+def _index_pieces(state: dict) -> dict[tuple[int, int], Piece]:
+    """Map (r, c) -> Piece for both players, built once per state."""
+    return {
+        (p["r"], p["c"]): Piece(player, p["type"], p["r"], p["c"])
+        for player in (0, 1)
+        for p in state[f"p{player}"]
+    }
+
+
+Cell = tuple[int, int]
+MoveIndex = dict[Cell, dict[Cell, dict]]
+
+
+def _index_moves(legal_moves: list[dict]) -> tuple[MoveIndex, MoveIndex]:
+    """Split legal moves into source -> destination -> move maps.
+
+    Returns ``(moves_by_from, forges_by_smith)`` keyed by tuples, so click
+    and overlay handling never build ``[r, c]`` lists to compare against.
+    """
+    moves: MoveIndex = {}
+    forges: MoveIndex = {}
+    for m in legal_moves:
+        if m["action"] == "move":
+            (fr, fc), (tr, tc) = m["from"], m["to"]
+            moves.setdefault((fr, fc), {})[(tr, tc)] = m
+        elif m["action"] == "forge":
+            (sr, sc), (tr, tc) = m["smith"], m["target"]
+            forges.setdefault((sr, sc), {})[(tr, tc)] = m
+    return moves, forges
+
+
 # ---------------------------------------------------------------------------
 # CalderaBoard — canvas widget
 # ---------------------------------------------------------------------------
@@ -58,15 +134,14 @@ class CalderaBoard(tk.Canvas):
         self.bind("<Button-1>", self._handle_click)
 
         self._state: dict | None = None
-        self._selected: tuple[int, int] | None = None
-        self._move_targets: set[tuple[int, int]] = set()
-        self._forge_targets: set[tuple[int, int]] = set()
-        self._capture_targets: set[tuple[int, int]] = set()
+        self._pieces: dict[tuple[int, int], Piece] = {}
+        self._overlay_by_cell: dict[tuple[int, int], int] = {}
 
     # -- public API -----------------------------------------------------
 
     def set_state(self, state: dict) -> None:
         self._state = state
+        self._pieces = _index_pieces(state)
         self._draw()
 
     def set_overlays(
@@ -76,17 +151,22 @@ class CalderaBoard(tk.Canvas):
         forge_targets: set[tuple[int, int]] | None = None,
         capture_targets: set[tuple[int, int]] | None = None,
     ) -> None:
-        self._selected = selected
-        self._move_targets = move_targets or set()
-        self._forge_targets = forge_targets or set()
-        self._capture_targets = capture_targets or set()
+        # Assign lowest priority first so higher-priority codes overwrite.
+        overlay: dict[tuple[int, int], int] = {}
+        for cells, code in (
+            (move_targets, OV_MOVE),
+            (forge_targets, OV_FORGE),
+            (capture_targets, OV_CAP),
+        ):
+            if cells:
+                overlay.update(dict.fromkeys(cells, code))
+        if selected is not None:
+            overlay[selected] = OV_SEL
+        self._overlay_by_cell = overlay
         self._draw()
 
     def clear_overlays(self) -> None:
-        self._selected = None
-        self._move_targets = set()
-        self._forge_targets = set()
-        self._capture_targets = set()
+        self._overlay_by_cell = {}
         self._draw()
 
     # -- drawing --------------------------------------------------------
@@ -97,11 +177,12 @@ class CalderaBoard(tk.Canvas):
             return
 
         board = self._state["board"]
+        overlay_get = self._overlay_by_cell.get
 
         for r in range(SIZE):
+            row_bbox = CELL_BBOX[r]
             for c in range(SIZE):
-                x0, y0 = c * CELL_PX, r * CELL_PX
-                x1, y1 = x0 + CELL_PX, y0 + CELL_PX
+                x0, y0, x1, y1 = row_bbox[c]
                 h = board[r][c]
 
                 # Cell fill
@@ -119,41 +200,24 @@ class CalderaBoard(tk.Canvas):
                             fill="#ffffff99", font=("Helvetica", 9),
                         )
 
-                # Overlay borders
-                bw = 3
-                if (r, c) == self._selected:
-                    self.create_rectangle(
-                        x0 + bw, y0 + bw, x1 - bw, y1 - bw,
-                        outline=SEL_COLOR, width=bw,
-                    )
-                elif (r, c) in self._capture_targets:
-                    self.create_rectangle(
-                        x0 + bw, y0 + bw, x1 - bw, y1 - bw,
-                        outline=CAP_COLOR, width=bw,
-                    )
-                elif (r, c) in self._forge_targets:
-                    self.create_rectangle(
-                        x0 + bw, y0 + bw, x1 - bw, y1 - bw,
-                        outline=FORGE_COLOR, width=bw,
-                    )
-                elif (r, c) in self._move_targets:
+                # Overlay border
+                code = overlay_get((r, c), OV_NONE)
+                if code:
+                    bw = 3
                     self.create_rectangle(
                         x0 + bw, y0 + bw, x1 - bw, y1 - bw,
-                        outline=MOVE_COLOR, width=bw,
+                        outline=OVERLAY_OUTLINE[code], width=bw,
                     )
 
         # Pieces
-        for player in (0, 1):
-            for p in self._state[f"p{player}"]:
-                self._draw_piece(p, player)
-
-    def _draw_piece(self, piece: dict, player: int) -> None:
-        r, c = piece["r"], piece["c"]
-        cx = c * CELL_PX + CELL_PX // 2
-        cy = r * CELL_PX + CELL_PX // 2
-        radius = CELL_PX // 2 - 10
-        color = P_COLORS[player]
-        letter = TYPE_LETTER[piece["type"]]
+        for piece in self._pieces.values():
+            self._draw_piece(piece)
+
+    def _draw_piece(self, piece: Piece) -> None:
+        cx, cy = CELL_CENTER[piece.r][piece.c]
+        radius = PIECE_RADIUS
+        color = P_COLORS[piece.player]
+        letter = TYPE_LETTER[piece.type]
 
         self.create_oval(
             cx - radius, cy - radius, cx + radius, cy + radius,
@@ -174,6 +238,12 @@ class CalderaBoard(tk.Canvas):
 # CalderaApp — main application
 # ---------------------------------------------------------------------------
 
+class _PendingAgent(NamedTuple):
+    """Placeholder for an agent still being constructed off the Tk thread."""
+
+    kind: str
+
+
 class CalderaApp:
     """Top-level GUI for Caldera — play or replay mode."""
 
@@ -195,10 +265,16 @@ class CalderaApp:
         self._replay_cursor = 0
         self._replay_moves: list[dict] | None = None
 
-        self._state: dict = self.game.initial_state()
+        self._state: dict = {}
+        self._pieces: dict[tuple[int, int], Piece] = {}
+        self._masks: tuple[int, int] = (0, 0)
+        self._enemy_mask = 0
+        self._set_state(self.game.initial_state())
         self._current_player: int = 0
         self._selected: tuple[int, int] | None = None
         self._legal_moves: list[dict] = []
+        self._moves_by_from: MoveIndex = {}
+        self._forges_by_smith: MoveIndex = {}
         self._human_waiting = False
         self._game_over = False
         self._forge_mode = False       # True when Smith selected and F pressed
@@ -206,9 +282,22 @@ class CalderaApp:
         self._generation = 0          # bumped on new game; guards stale AI callbacks
         self._closing = False
         self._autoplay_id: str | None = None
-        self._move_history: list[str] = []
+        self._move_history: deque[str] = deque(maxlen=HISTORY_ROWS)
+        # One long-lived AI worker takes (agent, generation, state, player,
+        # legal_moves) jobs and posts (generation, move) back; it never touches Tk.
+        self._ai_requests: queue.Queue[tuple[Any, int, dict, int, list[dict]] | None] = (
+            queue.Queue()
+        )
+        self._ai_results: queue.Queue[tuple[int, dict | None]] = queue.Queue()
+        self._ai_poll_id: str | None = None
+        # Agent loader threads post (generation, player, agent or load error)
+        # here; the lock orders those posts against _on_close's final drain.
+        self._agent_results: queue.Queue[tuple[int, int, Any]] = queue.Queue()
+        self._agent_lock = threading.Lock()
 
         self._build_ui()
+        threading.Thread(target=self._ai_loop, daemon=True).start()
+        self._ai_poll_id = self.root.after(AI_POLL_MS, self._drain_ai_queue)
 
         if replay_path:
             self._init_replay(replay_path)
@@ -340,11 +429,49 @@ class CalderaApp:
             elif kind == "random":
                 self._agents[pid] = "random"
             elif kind == "opus":
-                from opus.agent.agent import OpusAgent
-                self._agents[pid] = OpusAgent()
+                # Construction may be slow; build it off the Tk thread.
+                self._agents[pid] = _PendingAgent(kind)
+                threading.Thread(
+                    target=self._load_agent, args=(pid, kind, self._generation),
+                    daemon=True,
+                ).start()
             else:
                 self._agents[pid] = "random"
 
+    def _load_agent(self, pid: int, kind: str, gen: int) -> None:
+        try:
+            from opus.agent.agent import OpusAgent
+            agent: Any = OpusAgent()
+        except Exception as e:
+            agent = e  # reported by _agent_loaded
+        with self._agent_lock:
+            if not self._closing:
+                self._agent_results.put((gen, pid, agent))
+                return
+        # The window closed while this agent was loading; nobody will drain it.
+        if hasattr(agent, "close"):
+            agent.close()
+
+    def _agent_loaded(self, pid: int, agent: Any, gen: int) -> None:
+        if self._closing or gen != self._generation:
+            if hasattr(agent, "close"):
+                agent.close()  # built for a previous game
+            return
+        if isinstance(agent, Exception):
+            pending = self._agents.get(pid)
+            kind = pending.kind if isinstance(pending, _PendingAgent) else "AI"
+            self._game_over = True
+            self._human_waiting = False
+            self.status_var.set(
+                f"P{pid} ({kind}) agent failed to load: {type(agent).__name__}: {agent}"
+            )
+            self.action_var.set("")
+            self.board.clear_overlays()
+            return
+        self._agents[pid] = agent
+        if not self._game_over and pid == self._current_player:
+            self._start_turn()  # this player's turn was deferred while loading
+
     def _close_agents(self) -> None:
         for a in self._agents.values():
             if hasattr(a, "close"):
@@ -366,7 +493,9 @@ class CalderaApp:
             return
 
         self._current_player = self._state["ply"] % 2
+        self._enemy_mask = self._masks[1 - self._current_player]
         self._legal_moves = self.game.legal_moves(self._state, self._current_player)
+        self._moves_by_from, self._forges_by_smith = _index_moves(self._legal_moves)
         self._update_info()
 
         # No legal moves → forfeit
@@ -380,7 +509,13 @@ class CalderaApp:
 
         agent = self._agents.get(self._current_player, "human")
 
-        if agent == "human":
+        if isinstance(agent, _PendingAgent):
+            # Resumed from _agent_loaded once the agent is constructed.
+            self._human_waiting = False
+            self.status_var.set(f"Loading P{self._current_player} ({agent.kind}) agent\u2026")
+            self.action_var.set("")
+            self.board.clear_overlays()
+        elif agent == "human":
             self._human_waiting = True
             self.status_var.set(f"Your turn (P{self._current_player})")
             self.action_var.set("Click a piece to select it")
@@ -396,10 +531,9 @@ class CalderaApp:
             self.status_var.set(f"P{self._current_player} (AI) thinking...")
             self.action_var.set("")
             self.board.clear_overlays()
-            t = threading.Thread(
-                target=self._ai_worker, args=(agent, gen), daemon=True,
+            self._ai_requests.put(
+                (agent, gen, self._state, self._current_player, self._legal_moves)
             )
-            t.start()
 
     def _do_random_move(self) -> None:
         if not self._legal_moves:
@@ -407,14 +541,33 @@ class CalderaApp:
         move = _random.choice(self._legal_moves)
         self._execute_move(move)
 
-    def _ai_worker(self, agent: Any, gen: int) -> None:
+    def _ai_loop(self) -> None:
+        """Worker thread: serve AI move requests until a None sentinel arrives."""
+        while (job := self._ai_requests.get()) is not None:
+            agent, gen, state, player, legal_moves = job
+            try:
+                move = agent.select_move(self.game, state, player, legal_moves)
+            except Exception:
+                move = _random.choice(legal_moves) if legal_moves else None
+            self._ai_results.put((gen, move))
+
+    def _drain_ai_queue(self) -> None:
+        """Tk-side poller: dispatch loaded agents and at most one AI move per tick."""
+        if self._closing:
+            return
+        while True:
+            try:
+                gen, pid, agent = self._agent_results.get_nowait()
+            except queue.Empty:
+                break
+            self._agent_loaded(pid, agent, gen)
         try:
-            move = agent.select_move(
-                self.game, self._state, self._current_player, self._legal_moves,
-            )
-        except Exception:
-            move = _random.choice(self._legal_moves) if self._legal_moves else None
-        self.root.after(0, lambda: self._ai_move_ready(move, gen))
+            gen, move = self._ai_results.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            self._ai_move_ready(move, gen)
+        self._ai_poll_id = self.root.after(AI_POLL_MS, self._drain_ai_queue)
 
     def _ai_move_ready(self, move: dict | None, gen: int) -> None:
         if self._closing or gen != self._generation:
@@ -425,10 +578,12 @@ class CalderaApp:
     def _execute_move(self, move: dict) -> None:
         desc = self._describe_move(move, self._current_player)
         self._move_history.append(desc)
+        if self.history_list.size() >= HISTORY_ROWS:
+            self.history_list.delete(0)
         self.history_list.insert(tk.END, desc)
         self.history_list.see(tk.END)
 
-        self._state = self.game.apply_move(self._state, self._current_player, move)
+        self._set_state(self.game.apply_move(self._state, self._current_player, move))
         self._selected = None
         self.board.clear_overlays()
         self.board.set_state(self._state)
@@ -440,17 +595,9 @@ class CalderaApp:
         if move["action"] == "move":
             fr = move["from"]
             to = move["to"]
-            ptype = "?"
-            for p in self._state[f"p{player}"]:
-                if p["r"] == fr[0] and p["c"] == fr[1]:
-                    ptype = TYPE_LETTER[p["type"]]
-                    break
-            cap = ""
-            opp = 1 - player
-            for p in self._state[f"p{opp}"]:
-                if p["r"] == to[0] and p["c"] == to[1]:
-                    cap = "x"
-                    break
+            mover = self._pieces.get((fr[0], fr[1]))
+            ptype = TYPE_LETTER[mover.type] if mover is not None and mover.player == player else "?"
+            cap = "x" if self._masks[1 - player] & _bit(to[0], to[1]) else ""
             return f"{ply:>3}. {tag} {ptype} {fr[0]},{fr[1]}{cap}\u2192{to[0]},{to[1]}"
         elif move["action"] == "forge":
             t = move["target"]
@@ -464,39 +611,27 @@ class CalderaApp:
             return
 
         if self._selected is not None:
-            sr, sc = self._selected
-
-            if self._forge_mode:
-                # In forge mode, only accept forge actions
-                for m in self._legal_moves:
-                    if m["action"] == "forge" and m["smith"] == [sr, sc] and m["target"] == [r, c]:
-                        self._human_waiting = False
-                        self._forge_mode = False
-                        self._execute_move(m)
-                        return
-            else:
-                # In move mode, only accept move actions
-                for m in self._legal_moves:
-                    if m["action"] == "move" and m["from"] == [sr, sc] and m["to"] == [r, c]:
-                        self._human_waiting = False
-                        self._execute_move(m)
-                        return
+            # In forge mode only accept forge actions, otherwise only moves
+            index = self._forges_by_smith if self._forge_mode else self._moves_by_from
+            m = index.get(self._selected, {}).get((r, c))
+            if m is not None:
+                self._human_waiting = False
+                self._forge_mode = False
+                self._execute_move(m)
+                return
 
             # Clicked another friendly piece → switch selection
-            for p in self._state[f"p{self._current_player}"]:
-                if p["r"] == r and p["c"] == c:
-                    self._select_piece(r, c)
-                    return
+            if self._friendly_at(r, c) is not None:
+                self._select_piece(r, c)
+                return
 
             # Clicked empty / invalid → deselect
             self._deselect()
             return
 
         # No current selection — try to select a piece
-        for p in self._state[f"p{self._current_player}"]:
-            if p["r"] == r and p["c"] == c:
-                self._select_piece(r, c)
-                return
+        if self._friendly_at(r, c) is not None:
+            self._select_piece(r, c)
 
     def _toggle_forge(self) -> None:
         if not self._human_waiting or self._selected is None:
@@ -511,14 +646,8 @@ class CalderaApp:
         self._forge_mode = False
 
         # Determine if selected piece is a Smith
-        self._selected_is_smith = False
-        ptype = "?"
-        for p in self._state[f"p{self._current_player}"]:
-            if p["r"] == r and p["c"] == c:
-                ptype = p["type"]
-                if ptype == SMITH:
-                    self._selected_is_smith = True
-                break
+        piece = self._friendly_at(r, c)
+        self._selected_is_smith = piece is not None and piece.type == SMITH
 
         self._refresh_overlays()
 
@@ -529,21 +658,16 @@ class CalderaApp:
         r, c = self._selected
 
         move_targets: set[tuple[int, int]] = set()
-        forge_targets: set[tuple[int, int]] = set()
         capture_targets: set[tuple[int, int]] = set()
+        forge_targets = set(self._forges_by_smith.get((r, c), ()))
 
-        opp = 1 - self._current_player
-        enemy_pos = {(p["r"], p["c"]) for p in self._state[f"p{opp}"]}
+        enemy_mask = self._enemy_mask
 
-        for m in self._legal_moves:
-            if m["action"] == "move" and m["from"] == [r, c]:
-                dest = (m["to"][0], m["to"][1])
-                if dest in enemy_pos:
-                    capture_targets.add(dest)
-                else:
-                    move_targets.add(dest)
-            elif m["action"] == "forge" and m["smith"] == [r, c]:
-                forge_targets.add((m["target"][0], m["target"][1]))
+        for dest in self._moves_by_from.get((r, c), ()):
+            if _bit(*dest) & enemy_mask:
+                capture_targets.add(dest)
+            else:
+                move_targets.add(dest)
 
         # In forge mode show only forge targets; in move mode show moves + captures
         if self._forge_mode:
@@ -562,11 +686,8 @@ class CalderaApp:
             capture_targets=shown_captures,
         )
 
-        ptype_name = "?"
-        for p in self._state[f"p{self._current_player}"]:
-            if p["r"] == r and p["c"] == c:
-                ptype_name = p["type"].capitalize()
-                break
+        piece = self._friendly_at(r, c)
+        ptype_name = piece.type.capitalize() if piece is not None else "?"
 
         if self._forge_mode:
             n = len(forge_targets)
@@ -630,9 +751,13 @@ class CalderaApp:
 
         # Sync history list
         self.history_list.delete(0, tk.END)
-        for i in range(min(idx, len(self._replay_moves))):
-            rec = self._replay_moves[i]
-            self.history_list.insert(tk.END, self._describe_replay_move(rec, i + 1))
+        end = min(idx, len(self._replay_moves))
+        rows = [
+            self._describe_replay_move(self._replay_moves[i], i + 1)
+            for i in range(max(0, end - HISTORY_ROWS), end)
+        ]
+        if rows:
+            self.history_list.insert(tk.END, *rows)
         if self.history_list.size() > 0:
             self.history_list.see(tk.END)
 
@@ -694,6 +819,16 @@ class CalderaApp:
 
     # -- helpers --------------------------------------------------------
 
+    def _set_state(self, state: dict) -> None:
+        self._state = state
+        self._pieces = _index_pieces(state)
+        self._masks = _player_masks(self._pieces)
+
+    def _friendly_at(self, r: int, c: int) -> Piece | None:
+        if not self._masks[self._current_player] & _bit(r, c):
+            return None
+        return self._pieces[(r, c)]
+
     def _update_info(self, state: dict | None = None) -> None:
         st = state or self._state
         n0 = len(st["p0"])
@@ -704,15 +839,16 @@ class CalderaApp:
     def _new_game(self) -> None:
         self._generation += 1  # invalidate any in-flight AI callback
         self._close_agents()
-        self._state = self.game.initial_state()
+        self._set_state(self.game.initial_state())
         self._current_player = 0
         self._selected = None
         self._legal_moves = []
+        self._moves_by_from, self._forges_by_smith = {}, {}
         self._human_waiting = False
         self._game_over = False
         self._forge_mode = False
         self._selected_is_smith = False
-        self._move_history = []
+        self._move_history.clear()
         self.history_list.delete(0, tk.END)
         self.board.clear_overlays()
         self.board.set_state(self._state)
@@ -725,9 +861,21 @@ class CalderaApp:
         self.root.mainloop()
 
     def _on_close(self) -> None:
-        self._closing = True
+        with self._agent_lock:
+            # Loaders that finish after this close their own agent.
+            self._closing = True
         self._generation += 1  # invalidate any in-flight AI callback
         if self._autoplay_id is not None:
             self.root.after_cancel(self._autoplay_id)
+        if self._ai_poll_id is not None:
+            self.root.after_cancel(self._ai_poll_id)
+        self._ai_requests.put(None)  # stop the AI worker
+        while True:
+            try:
+                _, _, agent = self._agent_results.get_nowait()
+            except queue.Empty:
+                break
+            if hasattr(agent, "close"):
+                agent.close()  # loaded but never picked up by _drain_ai_queue
         self._close_agents()
         self.root.destroy()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import Any
 
@@ -18,14 +19,17 @@ class HumanAgent:
         player: PlayerId,
         legal_moves: list[JSONValue],
     ) -> JSONValue:
-        print(game.render(state))
-        print(f"player: {player}")
-        print("legal moves:")
-        for i, m in enumerate(legal_moves):
-            print(f"  [{i}] {m}")
+        out = sys.stdout
+        lines = "\n".join(f"  [{i}] {m}" for i, m in enumerate(legal_moves))
+        out.write(f"{game.render(state)}\nplayer: {player}\nlegal moves:\n{lines}\n")
 
         while True:
-            raw = input("choose move index> ").strip()
+            out.write("choose move index> ")
+            out.flush()
+            line = sys.stdin.readline()
+            if not line:
+                raise EOFError("stdin closed while waiting for a move")
+            raw = line.strip()
             try:
                 idx = int(raw)
             except ValueError:
@@ -6,6 +6,8 @@ from dataclasses import dataclass
 from ..game import Game, PlayerId
 from ..json_types import JSONValue
 
+_randrange = random.randrange
+
 
 @dataclass(slots=True)
 class RandomAgent:
@@ -18,5 +20,5 @@ class RandomAgent:
         player: PlayerId,
         legal_moves: list[JSONValue],
     ) -> JSONValue:
-        return random.choice(legal_moves)
+        return legal_moves[_randrange(len(legal_moves))]
 
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
-import json
+import os
+import queue
 import selectors
 import subprocess
+import threading
 import time
 from dataclasses import dataclass, field
-from typing import Any, TextIO
+from typing import Any, BinaryIO
 
+from .. import jsonio
 from ..game import Game, PlayerId
 from ..json_types import JSONValue
 
+_time_ns = time.time_ns
+_READ_CHUNK = 65536
+
 
 @dataclass(slots=True)
 class SubprocessAgent:
@@ -23,26 +29,30 @@ class SubprocessAgent:
     command: list[str]
     name: str = "subprocess"
     timeout_s: float = 3600.0  # default: up to an hour per turn (matches the spec)
-    _proc: subprocess.Popen[str] = field(init=False, repr=False)
-    _stdin: TextIO = field(init=False, repr=False)
-    _stdout: TextIO = field(init=False, repr=False)
-    _sel: selectors.BaseSelector = field(init=False, repr=False)
+    _proc: subprocess.Popen[bytes] = field(init=False, repr=False)
+    _stdin_fd: int = field(init=False, repr=False)
+    _stdout: BinaryIO = field(init=False, repr=False)
+    _lines: queue.SimpleQueue[bytes | None] = field(init=False, repr=False)
+    _envelope: tuple[str, bytes] | None = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
+        # (game name, pre-encoded turn-message prefix up to "player":)
+        self._envelope = None
         self._proc = subprocess.Popen(
             self.command,
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,
         )
         assert self._proc.stdin is not None
         assert self._proc.stdout is not None
-        self._stdin: TextIO = self._proc.stdin
-        self._stdout: TextIO = self._proc.stdout
-        self._sel = selectors.DefaultSelector()
-        self._sel.register(self._stdout, selectors.EVENT_READ)
+        # Turns are written straight to the pipe fd: one os.write per message.
+        self._stdin_fd = self._proc.stdin.fileno()
+        self._stdout = self._proc.stdout
+        # The shared reactor thread feeds complete stdout lines (and None at
+        # EOF) into this inbox, so select_move sleeps until output arrives.
+        self._lines = queue.SimpleQueue()
+        _REACTOR.register(self._stdout.fileno(), self._lines)
 
     def close(self) -> None:
         try:
@@ -53,7 +63,7 @@ class SubprocessAgent:
                 except subprocess.TimeoutExpired:
                     self._proc.kill()
         finally:
-            self._sel.close()
+            _REACTOR.unregister(self._stdout.fileno())
 
     def __del__(self) -> None:  # best-effort cleanup
         try:
@@ -71,16 +81,19 @@ class SubprocessAgent:
         if self._proc.poll() is not None:
             raise RuntimeError(f"bot process exited with code {self._proc.returncode}")
 
-        msg = {
-            "type": "turn",
-            "game": game.name,
-            "player": player,
-            "state": state,
-            "legal_moves": legal_moves,
-            "ts_ms": int(time.time() * 1000),
-        }
-        self._stdin.write(json.dumps(msg) + "\n")
-        self._stdin.flush()
+        # The constant head of the turn message is encoded once per game; each
+        # turn only encodes state and legal_moves and splices in the scalars.
+        env = self._envelope
+        if env is None or env[0] != game.name:
+            env = self._envelope = (game.name, b'{"type":"turn","game":%s,"player":' % jsonio.dumps(game.name))
+        payload = b'%s%d,"state":%s,"legal_moves":%s,"ts_ms":%d}\n' % (
+            env[1],
+            player,
+            jsonio.dumps(state),
+            jsonio.dumps(legal_moves),
+            _time_ns() // 1_000_000,
+        )
+        _write_all(self._stdin_fd, payload)
 
         deadline = time.monotonic() + self.timeout_s
         while True:
@@ -88,19 +101,21 @@ class SubprocessAgent:
             if remaining <= 0:
                 raise TimeoutError(f"bot timed out after {self.timeout_s}s")
 
-            events = self._sel.select(timeout=min(0.25, remaining))
-            if not events:
-                continue
-
-            line = self._stdout.readline()
-            if not line:
+            try:
+                line = self._lines.get(timeout=remaining)
+            except queue.Empty:
+                raise TimeoutError(f"bot timed out after {self.timeout_s}s") from None
+            if line is None:
+                self._lines.put(None)  # keep reporting EOF on later turns
                 raise RuntimeError("bot stdout closed")
-            line = line.strip()
-            if not line:
+            # Only "move" and "error" messages matter, and either type value
+            # must appear verbatim in the line; skip other chatter unparsed.
+            if b'"move"' not in line and b'"error"' not in line:
                 continue
+            line = line.strip()
             try:
-                resp = json.loads(line)
-            except json.JSONDecodeError:
+                resp = jsonio.loads(line)
+            except (jsonio.JSONDecodeError, UnicodeDecodeError):
                 # Allow debug logging on stdout; only JSON objects with {"type":"move"} matter.
                 continue
 
@@ -118,3 +133,82 @@ class SubprocessAgent:
             if "move" not in resp:
                 raise ValueError(f"bot move message missing 'move': {resp!r}")
             return resp["move"]
+
+
+class _Stream:
+    __slots__ = ("inbox", "rx")
+
+    def __init__(self, inbox: queue.SimpleQueue[bytes | None]) -> None:
+        self.inbox = inbox
+        self.rx = bytearray()
+
+    def feed(self, chunk: bytes) -> None:
+        """Split complete lines out of our own buffer and deliver them."""
+        rx = self.rx
+        scan = len(rx)  # bytes already buffered hold no newline
+        rx += chunk
+        start = 0
+        while (nl := rx.find(b"\n", scan)) != -1:
+            self.inbox.put(bytes(rx[start : nl + 1]))
+            start = scan = nl + 1
+        del rx[:start]
+
+    def eof(self) -> None:
+        if self.rx:
+            self.inbox.put(bytes(self.rx))  # unterminated final line
+            self.rx.clear()
+        self.inbox.put(None)
+
+
+class _Reactor:
+    """
+    One selector and one daemon thread reading every bot's stdout.
+
+    Each registered fd is read in large chunks when it becomes readable and
+    its lines are delivered to that agent's inbox; N bots cost one thread and
+    one epoll/kqueue fd instead of N.
+    """
+
+    def __init__(self) -> None:
+        self._sel = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def register(self, fd: int, inbox: queue.SimpleQueue[bytes | None]) -> None:
+        with self._lock:
+            self._sel.register(fd, selectors.EVENT_READ, _Stream(inbox))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="subprocess-agent-reactor", daemon=True)
+                self._thread.start()
+
+    def unregister(self, fd: int) -> None:
+        with self._lock:
+            try:
+                key = self._sel.unregister(fd)
+            except (KeyError, ValueError):
+                return  # already gone (EOF seen by the reactor)
+        key.data.eof()
+
+    def _run(self) -> None:
+        while True:
+            # Registrations made while blocked are picked up by epoll/kqueue;
+            # the timeout only bounds how long an idle reactor sleeps.
+            for key, _ in self._sel.select(timeout=1.0):
+                try:
+                    chunk = os.read(key.fd, _READ_CHUNK)
+                except OSError:
+                    chunk = b""  # pipe closed underneath us during shutdown
+                if chunk:
+                    key.data.feed(chunk)
+                else:
+                    self.unregister(key.fd)
+
+
+_REACTOR = _Reactor()
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        n = os.write(fd, view)
+        view = view[n:]
@@ -1,26 +1,35 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import shlex
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from .engine import play_match
-from .games.tictactoe import TicTacToe
-from .loading import load_symbol
 from .tournament import load_tournament_parser
 
+# Games, agents and the engine are imported inside the commands that use
+# them, so `list-games` and `--help` stay fast.
 
-def _builtin_games() -> dict[str, Any]:
-    return {
+
+@functools.cache
+def _builtin_games() -> Mapping[str, Any]:
+    from .games.tictactoe import TicTacToe
+
+    # Built-in games are stateless, so one shared instance serves every match.
+    return MappingProxyType({
         "tictactoe": TicTacToe(),
-    }
+    })
 
 
 def _load_game(spec: str) -> Any:
-    builtins = _builtin_games()
-    if spec in builtins:
-        return builtins[spec]
+    game = _builtin_games().get(spec)
+    if game is not None:
+        return game
+    from .loading import load_symbol
+
     obj = load_symbol(spec)
     return obj() if callable(obj) else obj
 
@@ -42,17 +51,21 @@ def _load_agent(spec: str) -> Any:
             raise ValueError("subprocess agent requires a command, e.g. subprocess:python3 -u bot.py")
         return SubprocessAgent(cmd)
 
+    from .loading import load_symbol
+
     obj = load_symbol(spec)
     return obj() if callable(obj) else obj
 
 
 def cmd_list_games(_: argparse.Namespace) -> int:
-    for name in sorted(_builtin_games().keys()):
+    for name in sorted(_builtin_games()):
         print(name)
     return 0
 
 
 def cmd_play(args: argparse.Namespace) -> int:
+    from .engine import play_match
+
     game = _load_game(args.game)
     a0 = _load_agent(args.p0)
     a1 = _load_agent(args.p1)
@@ -1,28 +1,29 @@
 from __future__ import annotations
 
-import json
+import functools
+import math
+import os
 import time
-from dataclasses import asdict, dataclass
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, overload
 
+from . import jsonio
 from .game import Game, PlayerId, Terminal
 from .json_types import JSONValue
 
 
-def _is_prime(n: int) -> bool:
-    if n <= 1:
-        return False
-    if n <= 3:
-        return True
-    if n % 2 == 0 or n % 3 == 0:
-        return False
-    i = 5
-    while i * i <= n:
-        if n % i == 0 or n % (i + 2) == 0:
-            return False
-        i += 6
-    return True
+@functools.cache
+def _prime_sieve(n: int) -> bytes:
+    """sieve[k] == 1 iff k is prime, for 0 <= k <= n."""
+    sieve = bytearray([1]) * (n + 1)
+    sieve[: min(2, n + 1)] = bytes(min(2, n + 1))
+    for i in range(2, math.isqrt(max(n, 0)) + 1):
+        if sieve[i]:
+            sieve[i * i :: i] = bytes(len(range(i * i, n + 1, i)))
+    return bytes(sieve)
 
 
 @dataclass(frozen=True, slots=True)
@@ -34,13 +35,115 @@ class MoveRecord:
     note: str | None = None
 
 
+class MoveHistory(Sequence[MoveRecord]):
+    """
+    Per-turn records stored column-wise (one array per MoveRecord field).
+
+    Reads behave like a list of MoveRecord; records are built on access, so
+    the engine only pays for five appends per turn.
+    """
+
+    __slots__ = ("turns", "players", "moves", "ms", "notes")
+
+    def __init__(self) -> None:
+        self.turns: list[int] = []
+        self.players = bytearray()
+        self.moves: list[JSONValue] = []
+        self.ms = array("d")
+        self.notes: list[str | None] = []
+
+    def append(self, turn: int, player: PlayerId, move: JSONValue, ms: float, note: str | None = None) -> None:
+        self.turns.append(turn)
+        self.players.append(player)
+        self.moves.append(move)
+        self.ms.append(ms)
+        self.notes.append(note)
+
+    def __len__(self) -> int:
+        return len(self.turns)
+
+    @overload
+    def __getitem__(self, i: int) -> MoveRecord: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> list[MoveRecord]: ...
+
+    def __getitem__(self, i: int | slice) -> MoveRecord | list[MoveRecord]:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        return MoveRecord(self.turns[i], self.players[i], self.moves[i], self.ms[i], self.notes[i])
+
+    def row(self, i: int) -> dict[str, Any]:
+        """Record i as a JSON-ready dict (the match log's move_history shape)."""
+        return {
+            "turn": self.turns[i],
+            "player": self.players[i],
+            "move": self.moves[i],
+            "ms": self.ms[i],
+            "note": self.notes[i],
+        }
+
+
 @dataclass(frozen=True, slots=True)
 class MatchResult:
     game: str
     winner: PlayerId | None
     reason: str
     turns: int
-    move_history: list[MoveRecord]
+    move_history: MoveHistory
+
+    def summary(self) -> dict[str, JSONValue]:
+        """The match log's `result` fields other than move_history."""
+        return {"game": self.game, "winner": self.winner, "reason": self.reason, "turns": self.turns}
+
+
+class MatchLogWriter:
+    """
+    Streams a match log to disk as the match is played.
+
+    The file is a single JSON document (`game`, `result` with `move_history`,
+    `final_state`, `final_render`), but each move record is appended as its
+    turn completes, one per line, so match end only writes the short trailer.
+    Records go to a temp file beside `path`, which finish() moves into place;
+    a match that never finishes leaves no partial log behind. The engine and
+    the GUI both write logs through this class, so replay reads one layout.
+    """
+
+    __slots__ = ("_fp", "_n", "_path", "_tmp")
+
+    def __init__(self, path: Path, game: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Not mkstemp: that creates the file 0600, and os.replace would keep it.
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{id(self):x}.tmp")
+        self._fp: BinaryIO = tmp.open("wb")
+        self._n = 0
+        self._path = path
+        self._tmp: Path | None = tmp
+        self._fp.write(b'{"game":%s,"result":{"move_history":[\n' % jsonio.dumps(game))
+
+    def record(self, row: dict[str, Any]) -> None:
+        """Append one move record (MoveHistory.row's shape)."""
+        if self._n:
+            self._fp.write(b",\n")
+        self._fp.write(jsonio.dumps(row))
+        self._n += 1
+
+    def finish(self, summary: dict[str, JSONValue], final_state: JSONValue, final_render: str) -> None:
+        """Write the trailer (`summary` as from MatchResult.summary()) and publish the file."""
+        self._fp.write(b"\n],%s}," % jsonio.dumps(summary)[1:-1])
+        self._fp.write(b'"final_state":%s,' % jsonio.dumps(final_state))
+        self._fp.write(b'"final_render":%s}\n' % jsonio.dumps(final_render))
+        self._fp.close()
+        assert self._tmp is not None
+        os.replace(self._tmp, self._path)
+        self._tmp = None
+
+    def close(self) -> None:
+        """Close the file, discarding it unless finish() already published it."""
+        self._fp.close()
+        if self._tmp is not None:
+            self._tmp.unlink(missing_ok=True)
+            self._tmp = None
 
 
 def play_match(
@@ -59,12 +162,42 @@ def play_match(
       - name: str
       - select_move(game, state, player, legal_moves) -> JSONValue
     """
+    log = MatchLogWriter(log_path, game.name) if log_path else None
+    try:
+        return _run_match(game, agent0, agent1, max_turns, prime_pause, log)
+    finally:
+        if log is not None:
+            log.close()
+
+
+def _run_match(
+    game: Game,
+    agent0: Any,
+    agent1: Any,
+    max_turns: int,
+    prime_pause: bool,
+    log: MatchLogWriter | None,
+) -> MatchResult:
     state: JSONValue = game.initial_state()
-    history: list[MoveRecord] = []
+    history = MoveHistory()
     player: PlayerId = 0
+    primes = _prime_sieve(max_turns) if prime_pause else b""
+    # Optional fast paths: terminal status and legal moves from one call, and
+    # an O(1) legality check instead of scanning the legal move list.
+    step_info = getattr(game, "step_info", None)
+    is_legal = getattr(game, "is_legal", None)
+    # Agents may get a trimmed view of the state (see docs/protocol.md).
+    compact_state = getattr(game, "compact_state", None)
+    apply_move = game.apply_move
+    terminal: Terminal
+    legal: list[JSONValue] | None
 
     for turn in range(1, max_turns + 1):
-        terminal: Terminal = game.terminal(state)
+        if step_info is not None:
+            terminal, legal = step_info(state, player)
+        else:
+            terminal = game.terminal(state)
+            legal = None
         if terminal.is_terminal:
             result = MatchResult(
                 game=game.name,
@@ -73,12 +206,13 @@ def play_match(
                 turns=turn - 1,
                 move_history=history,
             )
-            if log_path:
-                _write_log(log_path, game, result, state)
+            if log:
+                log.finish(result.summary(), state, game.render(state))
             return result
 
         agent = agent0 if player == 0 else agent1
-        legal = game.legal_moves(state, player)
+        if legal is None:
+            legal = game.legal_moves(state, player)
         if not legal:
             result = MatchResult(
                 game=game.name,
@@ -87,17 +221,19 @@ def play_match(
                 turns=turn - 1,
                 move_history=history,
             )
-            if log_path:
-                _write_log(log_path, game, result, state)
+            if log:
+                log.finish(result.summary(), state, game.render(state))
             return result
 
         t0 = time.perf_counter()
         try:
-            move = agent.select_move(game, state, player, legal)
+            move = agent.select_move(game, state if compact_state is None else compact_state(state), player, legal)
             ms = (time.perf_counter() - t0) * 1000.0
         except TimeoutError as e:
             ms = (time.perf_counter() - t0) * 1000.0
-            history.append(MoveRecord(turn=turn, player=player, move=None, ms=ms, note=f"timeout:{e}"))
+            history.append(turn, player, None, ms, f"timeout:{e}")
+            if log:
+                log.record(history.row(-1))
             result = MatchResult(
                 game=game.name,
                 winner=1 - player,
@@ -105,14 +241,14 @@ def play_match(
                 turns=turn - 1,
                 move_history=history,
             )
-            if log_path:
-                _write_log(log_path, game, result, state)
+            if log:
+                log.finish(result.summary(), state, game.render(state))
             return result
         except Exception as e:
             ms = (time.perf_counter() - t0) * 1000.0
-            history.append(
-                MoveRecord(turn=turn, player=player, move=None, ms=ms, note=f"agent_error:{type(e).__name__}:{e}")
-            )
+            history.append(turn, player, None, ms, f"agent_error:{type(e).__name__}:{e}")
+            if log:
+                log.record(history.row(-1))
             result = MatchResult(
                 game=game.name,
                 winner=1 - player,
@@ -120,12 +256,14 @@ def play_match(
                 turns=turn - 1,
                 move_history=history,
             )
-            if log_path:
-                _write_log(log_path, game, result, state)
+            if log:
+                log.finish(result.summary(), state, game.render(state))
             return result
 
-        if move not in legal:
-            history.append(MoveRecord(turn=turn, player=player, move=move, ms=ms, note="illegal_move"))
+        if not (is_legal(state, player, move) if is_legal is not None else move in legal):
+            history.append(turn, player, move, ms, "illegal_move")
+            if log:
+                log.record(history.row(-1))
             result = MatchResult(
                 game=game.name,
                 winner=1 - player,
@@ -133,14 +271,16 @@ def play_match(
                 turns=turn,
                 move_history=history,
             )
-            if log_path:
-                _write_log(log_path, game, result, state)
+            if log:
+                log.finish(result.summary(), state, game.render(state))
             return result
 
-        state = game.apply_move(state, player, move)
-        history.append(MoveRecord(turn=turn, player=player, move=move, ms=ms))
+        state = apply_move(state, player, move)
+        history.append(turn, player, move, ms)
+        if log:
+            log.record(history.row(-1))
 
-        if prime_pause and _is_prime(turn):
+        if primes and primes[turn]:
             print(f"[prime turn {turn}] extra analysis/coding cycle pause; press Enter to continue...")
             try:
                 input()
@@ -150,20 +290,6 @@ def play_match(
         player = 1 - player
 
     result = MatchResult(game=game.name, winner=None, reason="max_turns", turns=max_turns, move_history=history)
-    if log_path:
-        _write_log(log_path, game, result, state)
+    if log:
+        log.finish(result.summary(), state, game.render(state))
     return result
-
-
-def _write_log(path: Path, game: Game, result: MatchResult, final_state: JSONValue) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    payload = {
-        "game": game.name,
-        "result": {
-            **asdict(result),
-            "move_history": [asdict(r) for r in result.move_history],
-        },
-        "final_state": final_state,
-        "final_render": game.render(final_state),
-    }
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
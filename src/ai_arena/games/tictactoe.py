@@ -1,63 +1,105 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import ClassVar
 
 from ..game import PlayerId, Terminal
 from ..json_types import JSONValue
 
 
-def _winner(board: list[int]) -> PlayerId | None:
-    lines = [
-        (0, 1, 2),
-        (3, 4, 5),
-        (6, 7, 8),
-        (0, 3, 6),
-        (1, 4, 7),
-        (2, 5, 8),
-        (0, 4, 8),
-        (2, 4, 6),
-    ]
-    for a, b, c in lines:
-        v = board[a]
-        if v != 0 and v == board[b] and v == board[c]:
-            return 0 if v == 1 else 1
-    return None
+# Cells are bits 0..8 (row-major); each line is a 3-bit mask.
+_WIN_MASKS = (
+    0b000000111,
+    0b000111000,
+    0b111000000,
+    0b001001001,
+    0b010010010,
+    0b100100100,
+    0b100010001,
+    0b001010100,
+)
+_FULL = 0x1FF
+
+# Legal moves for every 9-bit empty-cell mask, in ascending cell order.
+_LEGAL_LUT: tuple[tuple[int, ...], ...] = tuple(
+    tuple(i for i in range(9) if empty >> i & 1) for empty in range(_FULL + 1)
+)
+
+
+def _bitboards(board: list[int]) -> tuple[int, int]:
+    """Per-player occupancy bitboards for a 9-cell board (1 = X, 2 = O)."""
+    b0 = b1 = 0
+    for i, v in enumerate(board):
+        if v == 1:
+            b0 |= 1 << i
+        elif v == 2:
+            b1 |= 1 << i
+    return b0, b1
+
+
+# _WIN_LUT[bb] is 1 iff a single player's bitboard bb contains a full line.
+_WIN_LUT = bytes(
+    1 if any(bb & m == m for m in _WIN_MASKS) else 0 for bb in range(_FULL + 1)
+)
+
+
+# Cell value (0 empty, 1 X, 2 O) -> glyph byte for render().
+_GLYPHS = bytes.maketrans(b"\x00\x01\x02", b".XO")
+
+_WIN = (
+    Terminal(is_terminal=True, winner=0, reason="win"),
+    Terminal(is_terminal=True, winner=1, reason="win"),
+)
+_DRAW = Terminal(is_terminal=True, winner=None, reason="draw")
+_ONGOING = Terminal(is_terminal=False, winner=None, reason="")
+
+
+def _terminal(b0: int, b1: int) -> Terminal:
+    if _WIN_LUT[b0]:
+        return _WIN[0]
+    if _WIN_LUT[b1]:
+        return _WIN[1]
+    if b0 | b1 == _FULL:
+        return _DRAW
+    return _ONGOING
 
 
 @dataclass(slots=True)
 class TicTacToe:
     name: str = "tictactoe"
+    # No per-match data lives on the instance (see docs/protocol.md).
+    stateless: ClassVar[bool] = True
 
     def initial_state(self) -> JSONValue:
         return {"board": [0] * 9}
 
     def legal_moves(self, state: JSONValue, player: PlayerId) -> list[JSONValue]:
-        board = list(state["board"])  # type: ignore[index]
-        return [i for i, v in enumerate(board) if v == 0]
+        b0, b1 = _bitboards(state["board"])  # type: ignore[index]
+        return list(_LEGAL_LUT[~(b0 | b1) & _FULL])
+
+    def is_legal(self, state: JSONValue, player: PlayerId, move: JSONValue) -> bool:
+        board: list[int] = state["board"]  # type: ignore[index]
+        return isinstance(move, int) and 0 <= move < 9 and board[move] == 0
 
     def apply_move(self, state: JSONValue, player: PlayerId, move: JSONValue) -> JSONValue:
         if not isinstance(move, int):
             raise ValueError(f"move must be int, got: {move!r}")
-        board = list(state["board"])  # type: ignore[index]
+        board: list[int] = state["board"]  # type: ignore[index]
         if not (0 <= move < 9) or board[move] != 0:
             raise ValueError(f"illegal move: {move!r}")
-        board[move] = 1 if player == 0 else 2
-        return {"board": board}
+        new_board = list(board)  # the only copy: apply_move never mutates its input
+        new_board[move] = 1 if player == 0 else 2
+        return {"board": new_board}
 
     def terminal(self, state: JSONValue) -> Terminal:
-        board = list(state["board"])  # type: ignore[index]
-        w = _winner(board)
-        if w is not None:
-            return Terminal(is_terminal=True, winner=w, reason="win")
-        if all(v != 0 for v in board):
-            return Terminal(is_terminal=True, winner=None, reason="draw")
-        return Terminal(is_terminal=False, winner=None, reason="")
+        return _terminal(*_bitboards(state["board"]))  # type: ignore[index]
+
+    def step_info(self, state: JSONValue, player: PlayerId) -> tuple[Terminal, list[JSONValue]]:
+        """terminal() and legal_moves() from a single board scan."""
+        b0, b1 = _bitboards(state["board"])  # type: ignore[index]
+        return _terminal(b0, b1), list(_LEGAL_LUT[~(b0 | b1) & _FULL])
 
     def render(self, state: JSONValue) -> str:
-        board = list(state["board"])  # type: ignore[index]
-        glyph = {0: ".", 1: "X", 2: "O"}
-        rows = []
-        for r in range(3):
-            rows.append(" ".join(glyph[board[3 * r + c]] for c in range(3)))
-        return "\n".join(rows)
+        g = bytes(state["board"]).translate(_GLYPHS).decode("ascii")  # type: ignore[index]
+        return f"{g[0]} {g[1]} {g[2]}\n{g[3]} {g[4]} {g[5]}\n{g[6]} {g[7]} {g[8]}"
 
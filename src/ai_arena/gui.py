@@ -1,33 +1,44 @@
 from __future__ import annotations
 
-import argparse
-import json
+import functools
+import queue
 import threading
 import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Mapping, Set as AbstractSet
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable
 
 from .game import Game, PlayerId, Terminal
 from .json_types import JSONValue
-from .loading import load_symbol
-from .replay import load_match_log, replay_from_log_payload
+
+# Tk, concurrent.futures and the JSON writer are imported inside launch_gui /
+# the methods that use them, so importing this module (e.g. for `ai-arena --help`
+# or tests) stays cheap.
+if TYPE_CHECKING:
+    import argparse
+    from concurrent.futures import Future
 
 
 class GUIHumanAgent:
     name: str = "human"
 
 
-def _builtin_games() -> dict[str, Any]:
+@functools.cache
+def _builtin_games() -> Mapping[str, Any]:
     from .games.tictactoe import TicTacToe
 
-    return {"tictactoe": TicTacToe}
+    return MappingProxyType({"tictactoe": TicTacToe})
 
 
 def _load_game(spec: str) -> Game:
-    builtins = _builtin_games()
-    if spec in builtins:
-        return builtins[spec]()  # type: ignore[return-value]
+    factory = _builtin_games().get(spec)
+    if factory is not None:
+        return factory()  # type: ignore[no-any-return]
+    from .loading import load_symbol
+
     obj = load_symbol(spec)
     return obj() if callable(obj) else obj
 
@@ -48,8 +59,14 @@ def _load_agent(spec: str) -> Any:
             raise ValueError("subprocess agent requires a command, e.g. subprocess:python3 -u bot.py")
         return SubprocessAgent(cmd)
 
+    from .loading import load_symbol
+
     obj = load_symbol(spec)
-    return obj() if callable(obj) else obj
+    if callable(obj):
+        return obj()
+    # A ready-made agent instance is closed when its match ends, so each match
+    # re-executes the module (bypassing the module cache) for a fresh copy.
+    return load_symbol(spec, fresh=True)
 
 
 def _maybe_close(agent: Any) -> None:
@@ -58,25 +75,89 @@ def _maybe_close(agent: Any) -> None:
         close()
 
 
+def _close_agents(agents: list[Any]) -> None:
+    for a in agents:
+        try:
+            _maybe_close(a)
+        except Exception:
+            pass
+
+
+# Game name recorded in a match log -> (repo-relative game file, class), or
+# None for a builtin game whose spec is its name.
+_LOG_GAME_SPECS: Mapping[str, tuple[str, str] | None] = MappingProxyType(
+    {
+        "tictactoe": None,
+        "skysummit": ("codex/game/game.py", "CodexGame"),
+        "opus_game": ("opus/game/game.py", "OpusGame"),
+        "gemini_game": ("gemini/game/game.py", "GeminiGame"),
+    }
+)
+
+
+@functools.cache
 def _repo_root() -> Path:
-    # .../src/ai_arena/gui.py -> repo root is 2 parents up.
-    return Path(__file__).resolve().parents[2]
+    # No resolve(): load_symbol resolves the spec path itself when it is loaded.
+    return Path(__file__).absolute().parents[2]
 
 
 def _infer_game_spec_from_log(payload: dict[str, Any]) -> str | None:
     name = payload.get("game") or payload.get("result", {}).get("game")
-    if name == "tictactoe":
-        return "tictactoe"
-    if name == "skysummit":
-        root = _repo_root()
-        return str(root / "codex" / "game" / "game.py") + ":CodexGame"
-    if name == "opus_game":
-        root = _repo_root()
-        return str(root / "opus" / "game" / "game.py") + ":OpusGame"
-    if name == "gemini_game":
-        root = _repo_root()
-        return str(root / "gemini" / "game" / "game.py") + ":GeminiGame"
-    return None
+    if not isinstance(name, str) or name not in _LOG_GAME_SPECS:
+        return None
+    entry = _LOG_GAME_SPECS[name]
+    if entry is None:
+        return name
+    rel, cls = entry
+    return f"{_repo_root() / rel}:{cls}"
+
+
+# Skysummit cell fill, height label and label color, indexed min(max(height, 0), 4) (4 == dome).
+_SKY_PALETTE = ("#dbe7f3", "#a8c6e6", "#79a6d2", "#f5d97b", "#3b4757")
+_SKY_LABELS = ("0", "1", "2", "3", "D")
+_SKY_LABEL_FILL = ("#12263a",) * 4 + ("#f1f5f9",)
+
+# Skysummit cell (outline, width): plain, then by rising precedence move hint,
+# build hint, selected.
+_SKY_OUTLINE = ("#22384d", 2)
+_SKY_OUTLINE_MOVE = ("#ff9f1c", 4)
+_SKY_OUTLINE_BUILD = ("#2ec4b6", 4)
+_SKY_OUTLINE_SELECTED = ("#e71d36", 5)
+
+# Skysummit worker colors, indexed [player][worker]; shared by pieces and the drag ghost.
+_SKY_PIECE_COLORS = (("#e63946", "#f77f00"), ("#4361ee", "#4cc9f0"))
+
+# Tic-tac-toe button background, plain and highlighted.
+_TTT_BG = "#ffffff"
+_TTT_HIGHLIGHT_BG = "#ffd6a5"
+
+# Skysummit workers: (player, worker, label).
+_SKY_PIECES = ((0, 0, "A"), (0, 1, "B"), (1, 0, "a"), (1, 1, "b"))
+
+CellBox = tuple[float, float, float, float]
+
+# Text-board renders kept per match while scrubbing through history.
+_RENDER_CACHE_SIZE = 64
+
+# Read-only fallbacks for states missing a field (or absent overlays); shared, never copied.
+_NO_CELLS: frozenset[int] = frozenset()
+_DEFAULT_SKY_BOARD = (0,) * 25
+
+
+def _sky_worker_cells(state: Mapping[str, Any], player: PlayerId) -> tuple[int | None, int | None]:
+    """Cells of `player`'s two Skysummit workers, by worker index (None = unplaced or malformed)."""
+    workers = state.get("workers")
+    raw = workers[player] if isinstance(workers, list) and 0 <= player < len(workers) else None
+    if not isinstance(raw, list) or len(raw) != 2:
+        return None, None
+    a, b = raw
+    return (a if type(a) is int else None), (b if type(b) is int else None)
+
+
+def _cell_ints(board: Any, n: int) -> tuple[int, ...]:
+    """First n cells of a JSON board as ints (non-int or missing cells -> 0)."""
+    cells = tuple(int(v) if isinstance(v, int) else 0 for v in board[:n]) if isinstance(board, list) else ()
+    return cells + (0,) * (n - len(cells))
 
 
 @dataclass(slots=True)
@@ -88,6 +169,120 @@ class MoveRow:
     note: str | None = None
 
 
+def _mask_cells(mask: int) -> set[int]:
+    """Cell indices of the set bits in a 25-cell bitmask."""
+    return {i for i in range(25) if mask >> i & 1}
+
+
+def _dump_log(path: Path, payload: dict[str, Any], render: Callable[[JSONValue], str]) -> None:
+    """
+    Write a match log through the engine's MatchLogWriter (same layout as engine logs).
+
+    payload["result"]["move_history"] holds MoveRow objects; each is encoded and
+    written on its own, so no full record list or document buffer is built.
+    final_render is rendered here too, off the Tk thread for autosaves.
+    """
+    from .engine import MatchLogWriter
+
+    result = payload["result"]
+    log = MatchLogWriter(Path(path).expanduser().resolve(), payload["game"])
+    try:
+        for r in result["move_history"]:
+            log.record({"turn": r.turn, "player": r.player, "move": r.move, "ms": r.ms, "note": r.note})
+        summary = {k: result[k] for k in ("game", "winner", "reason", "turns")}
+        log.finish(summary, payload["final_state"], render(payload["final_state"]))
+    finally:
+        log.close()
+
+
+def _autosave_log_quietly(path: Path, payload: dict[str, Any], render: Callable[[JSONValue], str]) -> None:
+    """_dump_log for --save-log, whose failures are ignored (as they always were)."""
+    try:
+        _dump_log(path, payload, render)
+    except Exception:
+        pass
+
+
+def _history_row(r: MoveRow) -> str:
+    move = str(r.move)
+    if len(move) > 80:
+        move = move[:77] + "..."
+    return f"{r.turn:03d} p{r.player}: {move} ({r.note})" if r.note else f"{r.turn:03d} p{r.player}: {move}"
+
+
+class _AgentWorker:
+    """
+    One daemon thread running submitted calls in order.
+
+    A daemon (unlike a ThreadPoolExecutor worker) does not hold up interpreter
+    exit, so closing the window while an agent is thinking exits at once.
+    Only agent turns run here; log autosaves get their own non-daemon thread.
+    """
+
+    __slots__ = ("_jobs",)
+
+    def __init__(self) -> None:
+        self._jobs: queue.Queue[tuple[Future[Any], Callable[..., Any], tuple[Any, ...]] | None] = queue.Queue()
+        threading.Thread(target=self._run, name="gui-agent", daemon=True).start()
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future[Any]:
+        from concurrent.futures import Future
+
+        future: Future[Any] = Future()
+        self._jobs.put((future, fn, args))
+        return future
+
+    def shutdown(self) -> None:
+        """Cancel queued calls and stop after the running one (without waiting for it)."""
+        while True:
+            try:
+                job = self._jobs.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None:
+                job[0].cancel()
+        self._jobs.put(None)
+
+    def _run(self) -> None:
+        while (job := self._jobs.get()) is not None:
+            future, fn, args = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+
+AgentTurn = tuple[list[JSONValue], JSONValue, float, Exception | None]
+
+
+def _agent_turn(
+    agent: Any,
+    game: Game,
+    state: JSONValue,
+    view: JSONValue,
+    player: PlayerId,
+    legal: list[JSONValue] | None,
+) -> AgentTurn:
+    """
+    Run one agent turn on the GUI's agent thread: (legal, move, ms, error).
+
+    Legal moves are generated here too (unless the caller already had them), so
+    an expensive rules engine doesn't stall Tk; an empty list means no agent call.
+    """
+    if legal is None:
+        legal = game.legal_moves(state, player)
+        if not legal:
+            return legal, None, 0.0, None
+    t0 = time.perf_counter()
+    try:
+        mv = agent.select_move(game, view, player, legal)
+        return legal, mv, (time.perf_counter() - t0) * 1000.0, None
+    except Exception as e:  # includes TimeoutError
+        return legal, None, (time.perf_counter() - t0) * 1000.0, e
+
+
 def _is_human(agent: Any) -> bool:
     return isinstance(agent, GUIHumanAgent)
 
@@ -128,18 +323,32 @@ def launch_gui(args: argparse.Namespace) -> int:
             self._canvas.pack(fill="both", expand=True)
 
             self._last_state: JSONValue | None = None
-            self._move_hints: set[int] = set()
-            self._build_hints: set[int] = set()
-            self._selected: set[int] = set()
+            self._board_ints: tuple[int, ...] = _DEFAULT_SKY_BOARD  # _last_state's board, coerced once
+            self._move_hints: AbstractSet[int] = _NO_CELLS
+            self._build_hints: AbstractSet[int] = _NO_CELLS
+            self._selected: AbstractSet[int] = _NO_CELLS
             self._piece_at: dict[int, tuple[int, int]] = {}
-            self._cell_boxes: dict[int, tuple[float, float, float, float]] = {}
+            self._cell_boxes: dict[int, CellBox] = {}
+            # (canvas w, canvas h, cell size, origin x, origin y, cell boxes); rebuilt on resize only
+            self._geom: tuple[int, int, float, float, float, dict[int, CellBox]] | None = None
+            # Persistent per-cell canvas items (rect, label, dome line, dome line),
+            # the (height, outline, width) they were last configured for, and the
+            # _geom they were laid out for.
+            self._cell_items: dict[int, tuple[int, int, int, int]] = {}
+            self._cell_state: dict[int, tuple[int, str, int]] = {}
+            self._items_geom: object = None
+            # Persistent (oval, label) items per (player, worker) and the cell each
+            # was last placed on (None = hidden); pieces move instead of being recreated.
+            self._piece_items: dict[tuple[int, int], tuple[int, int]] = {}
+            self._piece_drawn: dict[tuple[int, int], int | None] = {}
 
             self._drag_start_cell: int | None = None
             self._drag_start_xy: tuple[float, float] | None = None
             self._dragging: bool = False
             self._drag_cursor_xy: tuple[float, float] | None = None
+            self._ghost_pending: bool = False  # a coalesced ghost redraw is queued
 
-            self._canvas.bind("<Configure>", lambda _e: self._redraw())
+            self._canvas.bind("<Configure>", lambda _e: self._redraw())  # _geometry notices the new size
             self._canvas.bind("<ButtonPress-1>", self._on_press)
             self._canvas.bind("<B1-Motion>", self._on_motion)
             self._canvas.bind("<ButtonRelease-1>", self._on_release)
@@ -148,21 +357,36 @@ def launch_gui(args: argparse.Namespace) -> int:
             self,
             state: JSONValue,
             *,
-            move_hints: set[int] | None = None,
-            build_hints: set[int] | None = None,
-            selected: set[int] | None = None,
+            move_hints: AbstractSet[int] | None = None,
+            build_hints: AbstractSet[int] | None = None,
+            selected: AbstractSet[int] | None = None,
         ) -> None:
+            """The overlay sets are kept by reference; callers must not mutate them afterwards."""
+            move_hints = move_hints or _NO_CELLS
+            build_hints = build_hints or _NO_CELLS
+            selected = selected or _NO_CELLS
+            if (
+                state is self._last_state
+                and move_hints == self._move_hints
+                and build_hints == self._build_hints
+                and selected == self._selected
+            ):
+                return  # same state object and overlays: the canvas is already current
             self._last_state = state
-            self._move_hints = set(move_hints or set())
-            self._build_hints = set(build_hints or set())
-            self._selected = set(selected or set())
+            self._board_ints = _cell_ints(state.get("board") if isinstance(state, dict) else None, 25)
+            self._move_hints = move_hints
+            self._build_hints = build_hints
+            self._selected = selected
             self._redraw()
 
         def _point_to_cell(self, x: float, y: float) -> int | None:
-            for idx, (x1, y1, x2, y2) in self._cell_boxes.items():
-                if x1 <= x <= x2 and y1 <= y <= y2:
-                    return idx
-            return None
+            g = self._geom
+            if g is None:
+                return None  # nothing drawn yet
+            _w, _h, cell, ox, oy, _boxes = g
+            c = int((x - ox) // cell)
+            r = int((y - oy) // cell)
+            return r * 5 + c if 0 <= r < 5 and 0 <= c < 5 else None
 
         def _on_press(self, e: Any) -> None:
             cell = self._point_to_cell(float(e.x), float(e.y))
@@ -182,8 +406,14 @@ def launch_gui(args: argparse.Namespace) -> int:
             if (dx * dx + dy * dy) >= 100.0:
                 self._dragging = True
             self._drag_cursor_xy = (float(e.x), float(e.y))
-            if self._dragging:
-                self._redraw()
+            if self._dragging and not self._ghost_pending:
+                # Coalesce bursts of motion events into one redraw per idle pass.
+                self._ghost_pending = True
+                self.after_idle(self._flush_ghost)
+
+        def _flush_ghost(self) -> None:
+            self._ghost_pending = False
+            self._redraw_ghost()
 
         def _on_release(self, e: Any) -> None:
             start = self._drag_start_cell
@@ -207,99 +437,128 @@ def launch_gui(args: argparse.Namespace) -> int:
                 self._on_cell_click(end)
             self._redraw()
 
+        def _geometry(self) -> tuple[float, dict[int, CellBox]]:
+            """Cell size and per-cell boxes for the current canvas size (cached)."""
+            w = max(100, int(self._canvas.winfo_width()))
+            h = max(100, int(self._canvas.winfo_height()))
+            g = self._geom
+            if g is None or g[0] != w or g[1] != h:
+                size = min(w, h) - 40
+                cell = size / 5.0
+                ox = (w - size) / 2.0
+                oy = (h - size) / 2.0
+                boxes: dict[int, CellBox] = {}
+                for idx in range(25):
+                    r, c = divmod(idx, 5)
+                    x1 = ox + c * cell
+                    y1 = oy + r * cell
+                    boxes[idx] = (x1, y1, x1 + cell, y1 + cell)
+                g = self._geom = (w, h, cell, ox, oy, boxes)
+            return g[2], g[5]
+
         def _redraw(self) -> None:
-            self._canvas.delete("all")
+            canvas = self._canvas
 
             s = self._last_state if isinstance(self._last_state, dict) else {}
-            board = list(s.get("board", [0] * 25))
-            workers = s.get("workers", [[None, None], [None, None]])
-
-            w = max(100, int(self._canvas.winfo_width()))
-            h = max(100, int(self._canvas.winfo_height()))
-            size = min(w, h) - 40
-            cell = size / 5.0
-            ox = (w - size) / 2.0
-            oy = (h - size) / 2.0
+            board = self._board_ints
+            workers = (_sky_worker_cells(s, 0), _sky_worker_cells(s, 1))
 
-            self._cell_boxes = {}
+            cell, self._cell_boxes = self._geometry()
             self._piece_at = {}
-
-            def cell_box(idx: int) -> tuple[float, float, float, float]:
-                r, c = divmod(idx, 5)
-                x1 = ox + c * cell
-                y1 = oy + r * cell
-                x2 = x1 + cell
-                y2 = y1 + cell
-                return (x1, y1, x2, y2)
-
-            def cell_color(height: int) -> str:
-                palette = {
-                    0: "#dbe7f3",
-                    1: "#a8c6e6",
-                    2: "#79a6d2",
-                    3: "#f5d97b",
-                }
-                if height >= 4:
-                    return "#3b4757"
-                return palette.get(height, "#dbe7f3")
+            relayout = self._items_geom is not self._geom
+            self._items_geom = self._geom
+            selected, build_hints, move_hints = self._selected, self._build_hints, self._move_hints
+            boxes, cell_items, cell_state = self._cell_boxes, self._cell_items, self._cell_state
 
             for i in range(25):
-                x1, y1, x2, y2 = cell_box(i)
-                self._cell_boxes[i] = (x1, y1, x2, y2)
-                hval = int(board[i]) if i < len(board) and isinstance(board[i], int) else 0
-                fill = cell_color(hval)
-
-                outline = "#22384d"
-                width = 2
-                if i in self._move_hints:
-                    outline = "#ff9f1c"
-                    width = 4
-                if i in self._build_hints:
-                    outline = "#2ec4b6"
-                    width = 4
-                if i in self._selected:
-                    outline = "#e71d36"
-                    width = 5
-
-                self._canvas.create_rectangle(x1, y1, x2, y2, fill=fill, outline=outline, width=width)
-                self._canvas.create_text(
-                    x1 + 8,
-                    y1 + 8,
-                    text=str(hval if hval < 4 else "D"),
-                    fill="#12263a" if hval < 4 else "#f1f5f9",
-                    anchor="nw",
-                    font=("Menlo", 9, "bold"),
-                )
-
-                if hval >= 4:
-                    self._canvas.create_line(x1 + 8, y1 + 8, x2 - 8, y2 - 8, fill="#cbd5e1", width=2)
-                    self._canvas.create_line(x2 - 8, y1 + 8, x1 + 8, y2 - 8, fill="#cbd5e1", width=2)
-
-            piece_def = [
-                (0, 0, "A", "#e63946"),
-                (0, 1, "B", "#f77f00"),
-                (1, 0, "a", "#4361ee"),
-                (1, 1, "b", "#4cc9f0"),
-            ]
-            for pid, wid, label, color in piece_def:
-                try:
-                    pos = workers[pid][wid]
-                except Exception:
+                x1, y1, x2, y2 = boxes[i]
+                hval = board[i]
+
+                if i in selected:
+                    outline, width = _SKY_OUTLINE_SELECTED
+                elif i in build_hints:
+                    outline, width = _SKY_OUTLINE_BUILD
+                elif i in move_hints:
+                    outline, width = _SKY_OUTLINE_MOVE
+                else:
+                    outline, width = _SKY_OUTLINE
+
+                items = cell_items.get(i)
+                if items is None:
+                    items = cell_items[i] = (
+                        canvas.create_rectangle(x1, y1, x2, y2, tags="cell"),
+                        canvas.create_text(x1 + 8, y1 + 8, anchor="nw", font=("Menlo", 9, "bold"), tags="cell"),
+                        canvas.create_line(x1 + 8, y1 + 8, x2 - 8, y2 - 8, fill="#cbd5e1", width=2, tags="cell"),
+                        canvas.create_line(x2 - 8, y1 + 8, x1 + 8, y2 - 8, fill="#cbd5e1", width=2, tags="cell"),
+                    )
+                elif relayout:
+                    rect, label, d1, d2 = items
+                    canvas.coords(rect, x1, y1, x2, y2)
+                    canvas.coords(label, x1 + 8, y1 + 8)
+                    canvas.coords(d1, x1 + 8, y1 + 8, x2 - 8, y2 - 8)
+                    canvas.coords(d2, x2 - 8, y1 + 8, x1 + 8, y2 - 8)
+
+                level = min(max(hval, 0), 4)
+                look = (level, outline, width)
+                if cell_state.get(i) != look:
+                    cell_state[i] = look
+                    rect, label, d1, d2 = items
+                    dome_state = "normal" if level == 4 else "hidden"
+                    canvas.itemconfigure(rect, fill=_SKY_PALETTE[level], outline=outline, width=width)
+                    canvas.itemconfigure(label, text=_SKY_LABELS[level], fill=_SKY_LABEL_FILL[level])
+                    canvas.itemconfigure(d1, state=dome_state)
+                    canvas.itemconfigure(d2, state=dome_state)
+
+            # Between turns usually one worker moves: only pieces whose cell changed
+            # (or everything, after a resize) get new coords.
+            piece_at, piece_drawn = self._piece_at, self._piece_drawn
+            for pid, wid, label in _SKY_PIECES:
+                pos = workers[pid][wid]
+                if pos is None or pos not in boxes:
                     pos = None
-                if not isinstance(pos, int) or pos not in self._cell_boxes:
+                else:
+                    piece_at[pos] = (pid, wid)
+
+                key = (pid, wid)
+                items = self._piece_items.get(key)
+                if items is None:
+                    items = self._piece_items[key] = (
+                        canvas.create_oval(
+                            0, 0, 0, 0, fill=_SKY_PIECE_COLORS[pid][wid], outline="#0b132b", width=3, state="hidden", tags="piece"
+                        ),
+                        canvas.create_text(
+                            0, 0, text=label, fill="white", font=("Menlo", 14, "bold"), state="hidden", tags="piece"
+                        ),
+                    )
+                    piece_drawn[key] = None
+                prev = piece_drawn[key]
+                if pos == prev and not relayout:
                     continue
-                self._piece_at[int(pos)] = (pid, wid)
-                x1, y1, x2, y2 = self._cell_boxes[int(pos)]
+                piece_drawn[key] = pos
+                oval, text = items
+                if pos is None:
+                    canvas.itemconfigure(oval, state="hidden")
+                    canvas.itemconfigure(text, state="hidden")
+                    continue
+                x1, y1, x2, y2 = boxes[pos]
                 mx = (x1 + x2) / 2.0
                 my = (y1 + y2) / 2.0
                 r = cell * 0.30
-                self._canvas.create_oval(mx - r, my - r, mx + r, my + r, fill=color, outline="#0b132b", width=3)
-                self._canvas.create_text(mx, my, text=label, fill="white", font=("Menlo", 14, "bold"))
+                canvas.coords(oval, mx - r, my - r, mx + r, my + r)
+                canvas.coords(text, mx, my)
+                if prev is None:
+                    canvas.itemconfigure(oval, state="normal")
+                    canvas.itemconfigure(text, state="normal")
+
+            self._redraw_ghost()
 
-            # Drag preview: show a ghost piece under the cursor.
+        def _redraw_ghost(self) -> None:
+            """Drag preview: a ghost piece under the cursor, redrawn without touching the board."""
+            self._canvas.delete("ghost")
             if self._dragging and self._drag_start_cell in self._piece_at and self._drag_cursor_xy is not None:
+                cell, _boxes = self._geometry()
                 pid, wid = self._piece_at[self._drag_start_cell]
-                ghost_color = "#e63946" if (pid == 0 and wid == 0) else "#f77f00" if pid == 0 else "#4361ee" if wid == 0 else "#4cc9f0"
+                ghost_color = _SKY_PIECE_COLORS[pid][wid]
                 gx, gy = self._drag_cursor_xy
                 r = cell * 0.26
                 self._canvas.create_oval(
@@ -311,6 +570,7 @@ def launch_gui(args: argparse.Namespace) -> int:
                     outline="#0b132b",
                     width=2,
                     stipple="gray50",
+                    tags="ghost",
                 )
 
     class TicTacToeBoard(ttk.Frame):
@@ -318,6 +578,8 @@ def launch_gui(args: argparse.Namespace) -> int:
             super().__init__(master)
             self._on_click = on_click
             self._buttons: list[tk.Button] = []
+            # (text, bg) last pushed to each button; configure only on change
+            self._last_render: list[tuple[str, str]] = [("", "")] * 9
             for r in range(3):
                 self.rowconfigure(r, weight=1)
                 for c in range(3):
@@ -331,20 +593,20 @@ def launch_gui(args: argparse.Namespace) -> int:
             self,
             state: JSONValue,
             *,
-            highlights: set[int] | None = None,
-            selected: set[int] | None = None,
+            highlights: AbstractSet[int] | None = None,
+            selected: AbstractSet[int] | None = None,
         ) -> None:
             _ = selected
-            s = state if isinstance(state, dict) else {}
-            board = list(s.get("board", [0] * 9))
-            hi = highlights or set()
+            board = _cell_ints(state.get("board") if isinstance(state, dict) else None, 9)
+            hi = highlights or _NO_CELLS
+            last = self._last_render
             for i, btn in enumerate(self._buttons):
-                v = int(board[i]) if i < len(board) and isinstance(board[i], int) else 0
+                v = board[i]
                 ch = "." if v == 0 else ("X" if v == 1 else "O")
-                bg = "#ffffff"
-                if i in hi:
-                    bg = "#ffd6a5"
-                btn.configure(text=ch, bg=bg, activebackground=bg)
+                bg = _TTT_HIGHLIGHT_BG if i in hi else _TTT_BG
+                if last[i] != (ch, bg):
+                    last[i] = (ch, bg)
+                    btn.configure(text=ch, bg=bg, activebackground=bg)
 
     class TextBoard(ttk.Frame):
         def __init__(self, master: Any) -> None:
@@ -352,11 +614,14 @@ def launch_gui(args: argparse.Namespace) -> int:
             self._text = tk.Text(self, height=20, width=40, wrap="none")
             self._text.configure(state="disabled")
             self._text.pack(fill="both", expand=True)
+            self._last_text = ""
 
         def update_view(self, text: str) -> None:
+            if text == self._last_text:
+                return
+            self._last_text = text
             self._text.configure(state="normal")
-            self._text.delete("1.0", "end")
-            self._text.insert("1.0", text)
+            self._text.replace("1.0", "end", text)
             self._text.configure(state="disabled")
 
     class ArenaApp(tk.Tk):
@@ -386,17 +651,32 @@ def launch_gui(args: argparse.Namespace) -> int:
 
             self._game: Game | None = None
             self._agents: list[Any] = [None, None]
+            self._agents_line = ""  # "p0: <name> | p1: <name>" for the status panel, set at match start
 
             self._states: list[JSONValue] = []
             self._moves: list[MoveRow] = []
             self._cursor: int = 0
+            # Legal moves by state index; only the live tail is ever looked up.
+            self._legal_cache: dict[int, list[JSONValue]] = {}
+            # game.terminal() by state index; history states are never mutated.
+            self._terminal_cache: dict[int, Terminal] = {}
+            # game.render() text by state index for the text board; LRU, _RENDER_CACHE_SIZE entries.
+            self._render_cache: OrderedDict[int, str] = OrderedDict()
 
             self._replay_mode: bool = False
             self._result: Terminal | None = None
             self._result_override: Terminal | None = None  # e.g. no_legal_moves/illegal/timeout
 
             self._busy: bool = False
+            self._log_written: bool = False  # --save-log already written for this match
+            # Agents think on this single worker thread; the Tk thread polls the
+            # future, so no Tk call is ever made off the main thread.
+            self._agent_exec = _AgentWorker()
             self._autoplay: bool = False
+            self._autoplay_after: str | None = None  # pending after() id for the next tick
+            self._refresh_pending: bool = False  # a coalesced _do_refresh is queued
+            # Everything _do_refresh's output depends on, as of the last render; None forces one.
+            self._last_refresh_key: tuple[Any, ...] | None = None
 
             # Skysummit human input state
             self._ss_place_sel: list[int] = []
@@ -404,12 +684,24 @@ def launch_gui(args: argparse.Namespace) -> int:
             self._ss_dest_sel: int | None = None
             self._ss_build_sel: int | None = None
             self._ss_move_map: dict[tuple[int, int, int | None], JSONValue] = {}
-            self._ss_dests_by_worker: dict[int, set[int]] = {}
+            self._ss_dest_masks: list[int] = [0, 0]  # per worker: bit c set iff c is a legal destination
             self._ss_builds_by_worker_dest: dict[tuple[int, int], set[int | None]] = {}
+            self._ss_place_map: dict[tuple[int, int], JSONValue] = {}
+            # The legal-move list the indices above were built from; None = stale.
+            # Held by reference (not id()) so a recycled id can't alias a new list.
+            self._ss_indexed_for: list[JSONValue] | None = None
+            # TicTacToe highlight set, paired with the cached legal-move list it came from.
+            self._ttt_hints: tuple[list[JSONValue], frozenset[int]] | None = None
 
             # UI
             self._status_var = tk.StringVar(value="")
             self._action_var = tk.StringVar(value="")
+            self._thinking_var = tk.StringVar(value="")  # set only while an agent turn is running
+            # Last values pushed to the status/action labels and Build/Cancel buttons;
+            # Tk is only called when one changes.
+            self._last_status = ""
+            self._last_action = ""
+            self._last_action_btn_states: tuple[str, str] | None = None
 
             root = ttk.Frame(self, padding=12)
             root.pack(fill="both", expand=True)
@@ -435,19 +727,17 @@ def launch_gui(args: argparse.Namespace) -> int:
             self._board_widget: Any = None
 
             status = ttk.Label(self._right, textvariable=self._status_var, wraplength=360, justify="left")
-            status.pack(fill="x", pady=(0, 8))
+            status.pack(fill="x")
+            ttk.Label(self._right, textvariable=self._thinking_var).pack(fill="x", pady=(0, 8))
 
-            action_card = ttk.LabelFrame(self._right, text="Action", padding=10)
-            action_card.pack(fill="x", pady=(0, 10))
-            ttk.Label(action_card, textvariable=self._action_var, wraplength=330, justify="left").pack(fill="x", pady=(0, 8))
-            action_buttons = ttk.Frame(action_card)
-            action_buttons.pack(fill="x")
-            self._btn_build = ttk.Button(action_buttons, text="Build", command=self._confirm_skysummit_build)
-            self._btn_cancel_action = ttk.Button(action_buttons, text="Cancel", command=self._cancel_skysummit_action)
-            self._btn_build.grid(row=0, column=0, sticky="ew")
-            self._btn_cancel_action.grid(row=0, column=1, sticky="ew", padx=(6, 0))
-            action_buttons.columnconfigure(0, weight=1)
-            action_buttons.columnconfigure(1, weight=1)
+            self._action_card = ttk.LabelFrame(self._right, text="Action", padding=10)
+            self._action_card.pack(fill="x", pady=(0, 10))
+            ttk.Label(self._action_card, textvariable=self._action_var, wraplength=330, justify="left").pack(
+                fill="x", pady=(0, 8)
+            )
+            # Skysummit's Build/Cancel row; created by _ensure_action_widgets on first use.
+            self._btn_build: ttk.Button | None = None
+            self._btn_cancel_action: ttk.Button | None = None
 
             controls = ttk.Frame(self._right)
             controls.pack(fill="x", pady=(0, 10))
@@ -469,6 +759,7 @@ def launch_gui(args: argparse.Namespace) -> int:
 
             ttk.Label(runrow, text="Delay (ms):").pack(side="left", padx=(10, 0))
             self._delay_var = tk.StringVar(value=str(self._auto_delay_ms))
+            self._delay_var.trace_add("write", self._on_delay_change)
             self._delay_entry = ttk.Entry(runrow, textvariable=self._delay_var, width=7)
             self._delay_entry.pack(side="left", padx=(6, 0))
 
@@ -490,6 +781,10 @@ def launch_gui(args: argparse.Namespace) -> int:
             )
             self._hist.pack(fill="both", expand=False, pady=(4, 10))
             self._hist.bind("<<ListboxSelect>>", self._on_hist_select)
+            # The move list the Listbox mirrors and how many of its rows are shown.
+            self._hist_src: list[MoveRow] | None = None
+            self._hist_len = 0
+            self._hist_sel: int | None = None  # row last selected by _do_refresh
 
             self.protocol("WM_DELETE_WINDOW", self._on_close)
 
@@ -502,31 +797,38 @@ def launch_gui(args: argparse.Namespace) -> int:
 
         def _on_close(self) -> None:
             self._autoplay = False
-            for a in self._agents:
-                try:
-                    _maybe_close(a)
-                except Exception:
-                    pass
+            self._release_agents()
+            self._agent_exec.shutdown()
             self.destroy()
 
+        def _release_agents(self) -> None:
+            """Drop the current agents and close them off the Tk thread (a bot may take ~1 s to exit)."""
+            agents = [a for a in self._agents if a is not None]
+            self._agents = [None, None]
+            if agents:
+                # Not a daemon: closes still finish if the window is closing.
+                threading.Thread(target=_close_agents, args=(agents,), name="gui-agent-close").start()
+
         def _start_match(self, game_spec: str, p0_spec: str, p1_spec: str) -> None:
             self._replay_mode = False
             self._result = None
             self._result_override = None
 
-            # Close any prior agents.
-            for a in self._agents:
-                try:
-                    _maybe_close(a)
-                except Exception:
-                    pass
-            self._agents = [None, None]
+            self._release_agents()
 
             self._game = _load_game(game_spec)
             self._agents[0] = _load_agent(p0_spec)
             self._agents[1] = _load_agent(p1_spec)
+            self._agents_line = " | ".join(
+                f"p{i}: {getattr(a, 'name', None) or str(a)}" for i, a in enumerate(self._agents)
+            )
 
             self._states = [self._game.initial_state()]
+            self._last_refresh_key = None
+            self._log_written = False
+            self._legal_cache.clear()
+            self._terminal_cache.clear()
+            self._render_cache.clear()
             self._moves = []
             self._cursor = 0
 
@@ -551,6 +853,8 @@ def launch_gui(args: argparse.Namespace) -> int:
                 messagebox.showerror("Load log failed", str(e))
 
         def _load_log(self, path: Path) -> None:
+            from .replay import load_match_log, replay_from_log_payload
+
             payload = load_match_log(path)
             spec = self._explicit_game_spec if self._explicit_game_spec else None
             if not spec:
@@ -561,17 +865,16 @@ def launch_gui(args: argparse.Namespace) -> int:
             game = _load_game(spec)
             rep = replay_from_log_payload(game, payload)
 
-            # Close any running agents.
-            for a in self._agents:
-                try:
-                    _maybe_close(a)
-                except Exception:
-                    pass
-            self._agents = [None, None]
+            self._release_agents()
 
             self._game = game
             self._replay_mode = True
             self._states = rep.states
+            self._last_refresh_key = None
+            self._log_written = False
+            self._legal_cache.clear()
+            self._terminal_cache.clear()
+            self._render_cache.clear()
             self._moves = [MoveRow(turn=m.turn, player=m.player, move=m.move, ms=m.ms, note=m.note) for m in rep.moves]
             self._cursor = 0
             self._result = rep.terminal if rep.terminal.is_terminal else None
@@ -583,31 +886,44 @@ def launch_gui(args: argparse.Namespace) -> int:
 
         # --- board + selection ---
 
+        def _ensure_action_widgets(self) -> None:
+            if self._btn_build is not None:
+                return
+            action_buttons = ttk.Frame(self._action_card)
+            action_buttons.pack(fill="x")
+            self._btn_build = ttk.Button(action_buttons, text="Build", command=self._confirm_skysummit_build)
+            self._btn_cancel_action = ttk.Button(action_buttons, text="Cancel", command=self._cancel_skysummit_action)
+            self._btn_build.grid(row=0, column=0, sticky="ew")
+            self._btn_cancel_action.grid(row=0, column=1, sticky="ew", padx=(6, 0))
+            action_buttons.columnconfigure(0, weight=1)
+            action_buttons.columnconfigure(1, weight=1)
+
         def _ensure_board_widget(self) -> None:
+            game = self._game
+            kind = game.name if game is not None and game.name in ("skysummit", "tictactoe") else "text"
+            # A board only draws what changed since its last update_view, so the
+            # one already shown can serve a new match of the same kind.
+            if game is not None and self._board_widget is not None and kind == self._board_kind:
+                return
+
             for child in list(self._board_container.children.values()):
                 child.destroy()
-
-            game = self._game
+            self._board_widget = None
             if game is None:
                 return
 
-            if game.name == "skysummit":
-                self._board_kind = "skysummit"
+            self._board_kind = kind
+            if kind == "skysummit":
+                self._ensure_action_widgets()
                 self._board_widget = SkysummitBoard(
                     self._board_container,
                     on_cell_click=self._on_cell_click,
                     on_drag_drop=self._on_piece_drag_drop,
                 )
-                self._board_widget.pack(fill="both", expand=True)
-                return
-            if game.name == "tictactoe":
-                self._board_kind = "tictactoe"
+            elif kind == "tictactoe":
                 self._board_widget = TicTacToeBoard(self._board_container, on_click=self._on_cell_click)
-                self._board_widget.pack(fill="both", expand=True)
-                return
-
-            self._board_kind = "text"
-            self._board_widget = TextBoard(self._board_container)
+            else:
+                self._board_widget = TextBoard(self._board_container)
             self._board_widget.pack(fill="both", expand=True)
 
         def _reset_skysummit_ui_state(self) -> None:
@@ -616,8 +932,10 @@ def launch_gui(args: argparse.Namespace) -> int:
             self._ss_dest_sel = None
             self._ss_build_sel = None
             self._ss_move_map = {}
-            self._ss_dests_by_worker = {}
+            self._ss_dest_masks = [0, 0]
             self._ss_builds_by_worker_dest = {}
+            self._ss_place_map = {}
+            self._ss_indexed_for = None
 
         def _on_cell_click(self, idx: int) -> None:
             if self._busy or self._replay_mode:
@@ -638,7 +956,7 @@ def launch_gui(args: argparse.Namespace) -> int:
                 return
 
             if self._game.name == "tictactoe":
-                if idx in legal:
+                if idx in self._ttt_legal_cells(legal):
                     self._apply_live_move(idx, ms=None, note=None)
                 return
 
@@ -656,8 +974,9 @@ def launch_gui(args: argparse.Namespace) -> int:
                         self._ss_place_sel.append(idx)
 
                 if len(self._ss_place_sel) == 2:
-                    move = {"t": "place", "to": [self._ss_place_sel[0], self._ss_place_sel[1]]}
-                    if move in legal:
+                    self._index_skysummit_moves(legal)
+                    move = self._ss_place_map.get((self._ss_place_sel[0], self._ss_place_sel[1]))
+                    if move is not None:
                         self._reset_skysummit_ui_state()
                         self._apply_live_move(move, ms=None, note=None)
                     else:
@@ -672,20 +991,11 @@ def launch_gui(args: argparse.Namespace) -> int:
 
             self._index_skysummit_moves(legal)
 
-            worker_pos_by_idx: dict[int, int] = {}
-            try:
-                wpos = s.get("workers", [[None, None], [None, None]])[player]
-                if isinstance(wpos, list) and len(wpos) == 2:
-                    if isinstance(wpos[0], int):
-                        worker_pos_by_idx[int(wpos[0])] = 0
-                    if isinstance(wpos[1], int):
-                        worker_pos_by_idx[int(wpos[1])] = 1
-            except Exception:
-                worker_pos_by_idx = {}
+            wpos = _sky_worker_cells(s, player)
 
             # Clicking your worker selects it.
-            if idx in worker_pos_by_idx:
-                self._ss_worker_sel = worker_pos_by_idx[idx]
+            if idx in wpos:
+                self._ss_worker_sel = wpos.index(idx)
                 self._ss_dest_sel = None
                 self._ss_build_sel = None
                 self._refresh()
@@ -707,7 +1017,7 @@ def launch_gui(args: argparse.Namespace) -> int:
                     return
 
                 # Clicking another legal destination re-targets the move.
-                if idx in self._ss_dests_by_worker.get(self._ss_worker_sel, set()):
+                if self._ss_is_dest(self._ss_worker_sel, idx):
                     if self._select_skysummit_destination(self._ss_worker_sel, idx):
                         return
 
@@ -740,16 +1050,8 @@ def launch_gui(args: argparse.Namespace) -> int:
 
             self._index_skysummit_moves(legal)
 
-            w = None
-            try:
-                wpos = s.get("workers", [[None, None], [None, None]])[player]
-                if isinstance(wpos, list) and len(wpos) == 2:
-                    if wpos[0] == src:
-                        w = 0
-                    elif wpos[1] == src:
-                        w = 1
-            except Exception:
-                w = None
+            wpos = _sky_worker_cells(s, player)
+            w = wpos.index(src) if src in wpos else None
 
             if w is None:
                 return
@@ -761,7 +1063,7 @@ def launch_gui(args: argparse.Namespace) -> int:
             self._refresh()
 
         def _select_skysummit_destination(self, worker_idx: int, dst: int) -> bool:
-            if dst not in self._ss_dests_by_worker.get(worker_idx, set()):
+            if not self._ss_is_dest(worker_idx, dst):
                 return False
 
             self._ss_worker_sel = worker_idx
@@ -804,25 +1106,40 @@ def launch_gui(args: argparse.Namespace) -> int:
 
         def _toggle_autoplay(self) -> None:
             self._autoplay = bool(self._auto_var.get())
+            if self._autoplay:
+                self._schedule_autoplay()
+
+        def _on_delay_change(self, *_args: Any) -> None:
+            """Parse the delay entry when it is edited; partial or invalid text keeps the last good value."""
             try:
-                self._auto_delay_ms = int(self._delay_var.get().strip())
+                self._auto_delay_ms = max(1, int(self._delay_var.get().strip()))
             except ValueError:
-                self._auto_delay_ms = 250
-                self._delay_var.set(str(self._auto_delay_ms))
-            if self._autoplay:
-                self.after(self._auto_delay_ms, self._autoplay_tick)
+                pass
+
+        def _schedule_autoplay(self, spent_ms: float = 0.0) -> None:
+            """
+            Chain the next autoplay tick on the Tk event loop.
+
+            `spent_ms` (time the agent already took this turn) is deducted from the
+            delay so slow agents don't stretch the cadence; at most one tick is pending.
+            """
+            if self._autoplay_after is not None:
+                self.after_cancel(self._autoplay_after)
+            delay = max(1, self._auto_delay_ms - int(spent_ms))
+            self._autoplay_after = self.after(delay, self._autoplay_tick)
 
         def _autoplay_tick(self) -> None:
+            self._autoplay_after = None
             if not self._autoplay:
                 return
             if self._busy:
-                self.after(self._auto_delay_ms, self._autoplay_tick)
+                self._schedule_autoplay()
                 return
 
             if self._cursor < len(self._states) - 1:
                 self._cursor += 1
                 self._refresh()
-                self.after(self._auto_delay_ms, self._autoplay_tick)
+                self._schedule_autoplay()
                 return
 
             if self._replay_mode:
@@ -872,7 +1189,7 @@ def launch_gui(args: argparse.Namespace) -> int:
         # --- live stepping ---
 
         def _player_to_act(self) -> PlayerId:
-            return int(len(self._moves) % 2)
+            return len(self._moves) & 1
 
         def _is_at_latest(self) -> bool:
             return self._cursor == len(self._states) - 1
@@ -884,8 +1201,7 @@ def launch_gui(args: argparse.Namespace) -> int:
                 return self._result.is_terminal
             if self._game is None:
                 return True
-            t = self._game.terminal(self._states[-1])
-            return t.is_terminal
+            return self._terminal_for(len(self._states) - 1).is_terminal
 
         def _current_terminal(self) -> Terminal:
             if self._result_override is not None:
@@ -894,26 +1210,49 @@ def launch_gui(args: argparse.Namespace) -> int:
                 return self._result
             if self._game is None:
                 return Terminal(is_terminal=True, winner=None, reason="no_game")
-            return self._game.terminal(self._states[-1])
+            return self._terminal_for(len(self._states) - 1)
+
+        def _render_of(self, idx: int) -> str:
+            cache = self._render_cache
+            text = cache.get(idx)
+            if text is not None:
+                cache.move_to_end(idx)
+                return text
+            assert self._game is not None
+            text = cache[idx] = self._game.render(self._states[idx])
+            if len(cache) > _RENDER_CACHE_SIZE:
+                cache.popitem(last=False)
+            return text
+
+        def _terminal_for(self, idx: int) -> Terminal:
+            t = self._terminal_cache.get(idx)
+            if t is None:
+                assert self._game is not None
+                t = self._terminal_cache[idx] = self._game.terminal(self._states[idx])
+            return t
 
         def _current_legal_moves(self) -> list[JSONValue] | None:
             if self._game is None:
                 return None
             if self._is_match_over():
                 return None
-            state = self._states[-1]
+            idx = len(self._states) - 1
+            cached = self._legal_cache.get(idx)
+            if cached is not None:
+                return cached
+            state = self._states[idx]
             player = self._player_to_act()
             legal = self._game.legal_moves(state, player)
             if not legal:
-                self._result_override = Terminal(is_terminal=True, winner=1 - player, reason="no_legal_moves")
-                if self._save_log_path:
-                    try:
-                        self._write_log(self._save_log_path)
-                    except Exception:
-                        pass
+                self._end_with_no_legal_moves(player)
                 return None
+            self._legal_cache[idx] = legal
             return legal
 
+        def _end_with_no_legal_moves(self, player: PlayerId) -> None:
+            self._result_override = Terminal(is_terminal=True, winner=1 - player, reason="no_legal_moves")
+            self._autosave_log()
+
         def _step_live(self) -> None:
             if self._busy or self._game is None:
                 return
@@ -921,11 +1260,7 @@ def launch_gui(args: argparse.Namespace) -> int:
                 return
             if len(self._moves) >= self._max_turns:
                 self._result_override = Terminal(is_terminal=True, winner=None, reason="max_turns")
-                if self._save_log_path:
-                    try:
-                        self._write_log(self._save_log_path)
-                    except Exception:
-                        pass
+                self._autosave_log()
                 self._refresh()
                 return
 
@@ -935,45 +1270,43 @@ def launch_gui(args: argparse.Namespace) -> int:
                 self._refresh()
                 return
 
-            legal = self._current_legal_moves()
-            if legal is None:
-                self._refresh()
-                return
-
-            state = self._states[-1]
+            idx = len(self._states) - 1
+            state = self._states[idx]
             game = self._game
+            compact_state = getattr(game, "compact_state", None)
+            # Agents get the trimmed view (docs/protocol.md).
+            view = state if compact_state is None else compact_state(state)
 
             self._busy = True
             self._btn_next.configure(state="disabled")
-            self._status_var.set(self._status_var.get() + "\n(thinking...)")
-
-            def worker() -> None:
-                t0 = time.perf_counter()
-                try:
-                    mv = agent.select_move(game, state, player, legal)
-                    ms = (time.perf_counter() - t0) * 1000.0
-                    err: Exception | None = None
-                except Exception as e:  # includes TimeoutError
-                    mv = None
-                    ms = (time.perf_counter() - t0) * 1000.0
-                    err = e
-
-                def done() -> None:
-                    self._busy = False
-                    self._btn_next.configure(state="normal")
-                    if err is not None:
-                        reason = "timeout" if isinstance(err, TimeoutError) else "agent_error"
-                        self._end_live_with_forfeit(player, reason, f"{type(err).__name__}:{err}", ms)
-                        return
-                    assert mv is not None
-                    if mv not in legal:
-                        self._end_live_with_forfeit(player, "illegal_move", "illegal_move", ms, move=mv)
-                        return
-                    self._apply_live_move(mv, ms=ms, note=None)
-
-                self.after(0, done)
-
-            threading.Thread(target=worker, daemon=True).start()
+            self._thinking_var.set("(thinking...)")
+            future = self._agent_exec.submit(_agent_turn, agent, game, state, view, player, self._legal_cache.get(idx))
+            self._poll_agent(future, player)
+
+        def _poll_agent(self, future: Future[AgentTurn], player: PlayerId, wait_ms: int = 1) -> None:
+            if not future.done():
+                # Back off from 1 ms to 50 ms: fast agents are picked up almost at once,
+                # while a long think costs ~20 wakeups/s instead of 200.
+                self.after(wait_ms, self._poll_agent, future, player, min(wait_ms * 2, 50))
+                return
+            self._busy = False
+            self._btn_next.configure(state="normal")
+            self._thinking_var.set("")
+            legal, mv, ms, err = future.result()
+            if not legal:
+                self._end_with_no_legal_moves(player)
+                self._refresh()
+                return
+            if err is not None:
+                reason = "timeout" if isinstance(err, TimeoutError) else "agent_error"
+                self._end_live_with_forfeit(player, reason, f"{type(err).__name__}:{err}", ms)
+                return
+            assert mv is not None
+            is_legal = getattr(self._game, "is_legal", None)
+            if not (is_legal(self._states[-1], player, mv) if is_legal is not None else mv in legal):
+                self._end_live_with_forfeit(player, "illegal_move", "illegal_move", ms, move=mv)
+                return
+            self._apply_live_move(mv, ms=ms, note=None)
 
         def _apply_live_move(self, move: JSONValue, *, ms: float | None, note: str | None) -> None:
             assert self._game is not None
@@ -982,25 +1315,24 @@ def launch_gui(args: argparse.Namespace) -> int:
 
             s2 = self._game.apply_move(state, player, move)
             self._states.append(s2)
+            self._legal_cache.clear()
             self._moves.append(MoveRow(turn=len(self._moves) + 1, player=player, move=move, ms=ms, note=note))
 
-            if self._cursor == len(self._states) - 2:
-                self._cursor = len(self._states) - 1
+            tail = len(self._states) - 1
+            if self._cursor == tail - 1:
+                self._cursor = tail
 
-            t = self._game.terminal(s2)
+            t = self._terminal_for(tail)
             if t.is_terminal:
                 self._result = t
 
             self._refresh()
 
-            if self._result is not None and self._result.is_terminal and self._save_log_path:
-                try:
-                    self._write_log(self._save_log_path)
-                except Exception:
-                    pass
+            if self._result is not None and self._result.is_terminal:
+                self._autosave_log()
 
             if self._autoplay:
-                self.after(self._auto_delay_ms, self._autoplay_tick)
+                self._schedule_autoplay(ms or 0.0)
 
         def _end_live_with_forfeit(
             self,
@@ -1015,11 +1347,7 @@ def launch_gui(args: argparse.Namespace) -> int:
             self._result_override = Terminal(is_terminal=True, winner=1 - player, reason=reason)
             self._refresh()
 
-            if self._save_log_path:
-                try:
-                    self._write_log(self._save_log_path)
-                except Exception:
-                    pass
+            self._autosave_log()
 
         # --- log IO ---
 
@@ -1034,51 +1362,87 @@ def launch_gui(args: argparse.Namespace) -> int:
             if not p:
                 return
             try:
-                self._write_log(Path(p))
+                _dump_log(Path(p), self._log_payload(), self._game.render)
             except Exception as e:
                 messagebox.showerror("Save log failed", str(e))
 
-        def _write_log(self, path: Path) -> None:
+        def _autosave_log(self) -> None:
+            """Write --save-log once per match, when it ends (later terminal paths are no-ops)."""
+            if not self._save_log_path or self._log_written:
+                return
+            self._log_written = True
+            # Failures are ignored here, so encoding and writing happen off the
+            # Tk thread. Not a daemon (nor the agent worker, which _on_close
+            # cancels): the log is still written if the window closes meanwhile.
+            assert self._game is not None
+            threading.Thread(
+                target=_autosave_log_quietly,
+                args=(self._save_log_path, self._log_payload(), self._game.render),
+                name="gui-log-save",
+            ).start()
+
+        def _log_payload(self) -> dict[str, Any]:
             assert self._game is not None
-            final_state = self._states[-1]
             terminal = self._current_terminal()
 
-            payload = {
+            return {
                 "game": self._game.name,
                 "result": {
                     "game": self._game.name,
                     "winner": terminal.winner,
                     "reason": terminal.reason,
                     "turns": len(self._moves),
-                    "move_history": [
-                        {
-                            "turn": r.turn,
-                            "player": r.player,
-                            "move": r.move,
-                            "ms": r.ms,
-                            "note": r.note,
-                        }
-                        for r in self._moves
-                    ],
+                    "move_history": tuple(self._moves),  # encoded row by row in _dump_log
                 },
-                "final_state": final_state,
-                "final_render": self._game.render(final_state),
+                "final_state": self._states[-1],
             }
-            path = Path(path).expanduser().resolve()
-            path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
 
         # --- rendering / refresh ---
 
         def _refresh(self) -> None:
+            """Schedule a UI refresh; any number of calls before the next idle pass render once."""
+            if not self._refresh_pending:
+                self._refresh_pending = True
+                self.after_idle(self._flush_refresh)
+
+        def _flush_refresh(self) -> None:
+            if self._refresh_pending:
+                self._refresh_pending = False
+                self._do_refresh()
+
+        def _set_status(self, text: str) -> None:
+            if text != self._last_status:
+                self._last_status = text
+                self._status_var.set(text)
+
+        def _do_refresh(self) -> None:
             game = self._game
             if game is None:
-                self._status_var.set("No game loaded.")
+                self._set_status("No game loaded.")
                 return
 
+            n_states = len(self._states)
+            moves = self._moves
+            n_moves = len(moves)
+            key = (
+                self._cursor,
+                n_states,
+                n_moves,
+                self._replay_mode,
+                self._result,
+                self._result_override,
+                self._ss_worker_sel,
+                self._ss_dest_sel,
+                self._ss_build_sel,
+                tuple(self._ss_place_sel),
+            )
+            if key == self._last_refresh_key:
+                return  # nothing visible changed since the last render
+            self._last_refresh_key = key
+
             cur_state = self._states[self._cursor]
 
-            move_hints: set[int] = set()
+            move_hints: AbstractSet[int] = _NO_CELLS
             build_hints: set[int] = set()
             selected: set[int] = set()
             action_text = "Watch mode."
@@ -1091,7 +1455,7 @@ def launch_gui(args: argparse.Namespace) -> int:
                     legal = self._current_legal_moves()
                     if legal is not None:
                         if game.name == "tictactoe":
-                            move_hints = set(int(x) for x in legal if isinstance(x, int))
+                            move_hints = self._ttt_legal_cells(legal)
                             action_text = "Your turn. Click a highlighted square."
                         elif game.name == "skysummit":
                             self._index_skysummit_moves(legal)
@@ -1109,25 +1473,18 @@ def launch_gui(args: argparse.Namespace) -> int:
                                     or self._ss_dest_sel is not None
                                     or self._ss_build_sel is not None
                                 )
-                                wpos: list[int] = []
-                                try:
-                                    raw = s.get("workers", [[None, None], [None, None]])[player]
-                                    if isinstance(raw, list):
-                                        wpos = [int(x) for x in raw if isinstance(x, int)]
-                                except Exception:
-                                    wpos = []
+                                wpos = _sky_worker_cells(s, player)
+                                sel_pos = wpos[self._ss_worker_sel] if self._ss_worker_sel is not None else None
+                                if sel_pos is not None:
+                                    selected.add(sel_pos)
 
                                 if self._ss_worker_sel is None:
-                                    move_hints = set(wpos)
+                                    move_hints = {p for p in wpos if p is not None}
                                     action_text = "Select a worker (or drag it) to start your move."
                                 elif self._ss_dest_sel is None:
-                                    if 0 <= self._ss_worker_sel < len(wpos):
-                                        selected.add(int(wpos[self._ss_worker_sel]))
-                                    move_hints = set(self._ss_dests_by_worker.get(self._ss_worker_sel, set()))
+                                    move_hints = _mask_cells(self._ss_dest_masks[self._ss_worker_sel])
                                     action_text = "Choose a destination for the selected worker."
                                 else:
-                                    if 0 <= self._ss_worker_sel < len(wpos):
-                                        selected.add(int(wpos[self._ss_worker_sel]))
                                     selected.add(int(self._ss_dest_sel))
                                     if self._ss_build_sel is not None:
                                         selected.add(int(self._ss_build_sel))
@@ -1154,67 +1511,101 @@ def launch_gui(args: argparse.Namespace) -> int:
             elif self._board_kind == "tictactoe":
                 self._board_widget.update_view(cur_state, highlights=move_hints, selected=selected)
             else:
-                self._board_widget.update_view(game.render(cur_state))
+                self._board_widget.update_view(self._render_of(self._cursor))
 
             live_player = self._player_to_act() if not self._replay_mode else None
             term = self._current_terminal() if not self._replay_mode else (self._result or Terminal(False, None, ""))
 
             lines: list[str] = []
             lines.append(f"game: {game.name} ({'replay' if self._replay_mode else 'live'})")
-            lines.append(f"frame: {self._cursor}/{len(self._states) - 1}")
+            lines.append(f"frame: {self._cursor}/{n_states - 1}")
             if not self._replay_mode:
                 lines.append(f"to_act: player {live_player}")
-                lines.append(
-                    f"p0: {getattr(self._agents[0], 'name', str(self._agents[0]))} | "
-                    f"p1: {getattr(self._agents[1], 'name', str(self._agents[1]))}"
-                )
+                lines.append(self._agents_line)
             if term.is_terminal:
                 lines.append(f"terminal: winner={term.winner} reason={term.reason}")
-            self._status_var.set("\n".join(lines))
-            self._action_var.set(action_text)
-
-            self._hist.delete(0, "end")
-            for r in self._moves:
-                suffix = f" ({r.note})" if r.note else ""
-                self._hist.insert("end", f"{r.turn:03d} p{r.player}: {r.move}{suffix}")
-            if self._moves:
-                try:
-                    sel = max(0, min(self._cursor - 1, len(self._moves) - 1))
-                    self._hist.selection_clear(0, "end")
-                    self._hist.selection_set(sel)
-                except Exception:
-                    pass
+            self._set_status("\n".join(lines))
+            if action_text != self._last_action:
+                self._last_action = action_text
+                self._action_var.set(action_text)
+
+            # Moves are only ever appended to a match's list, so add just the new
+            # rows (one insert call); a different list means a new match or log.
+            if self._hist_src is not moves or self._hist_len > n_moves:
+                self._hist.delete(0, "end")
+                self._hist_src = moves
+                self._hist_len = 0
+                self._hist_sel = None
+            if self._hist_len < n_moves:
+                self._hist.insert("end", *[_history_row(moves[i]) for i in range(self._hist_len, n_moves)])
+                self._hist_len = n_moves
+            if n_moves:
+                sel = max(0, min(self._cursor - 1, n_moves - 1))
+                if sel != self._hist_sel:
+                    try:
+                        self._hist.selection_clear(0, "end")
+                        self._hist.selection_set(sel)
+                        self._hist_sel = sel
+                    except Exception:
+                        pass
 
-            if self._board_kind == "skysummit":
-                self._btn_build.configure(state=("normal" if can_build else "disabled"))
-                self._btn_cancel_action.configure(state=("normal" if can_cancel else "disabled"))
-            else:
-                self._btn_build.configure(state="disabled")
-                self._btn_cancel_action.configure(state="disabled")
+            if self._btn_build is not None and self._btn_cancel_action is not None:
+                skysummit = self._board_kind == "skysummit"
+                btn_states = (
+                    "normal" if skysummit and can_build else "disabled",
+                    "normal" if skysummit and can_cancel else "disabled",
+                )
+                if btn_states != self._last_action_btn_states:
+                    self._last_action_btn_states = btn_states
+                    self._btn_build.configure(state=btn_states[0])
+                    self._btn_cancel_action.configure(state=btn_states[1])
 
         def _index_skysummit_moves(self, legal: list[JSONValue]) -> None:
-            self._ss_move_map = {}
-            self._ss_dests_by_worker = {0: set(), 1: set()}
-            self._ss_builds_by_worker_dest = {}
+            # _current_legal_moves returns the same cached list for the whole turn,
+            # so the index built on its first click/refresh serves the rest of it.
+            if legal is self._ss_indexed_for:
+                return
+            move_map: dict[tuple[int, int, int | None], JSONValue] = {}
+            place_map: dict[tuple[int, int], JSONValue] = {}
+            dest_masks = [0, 0]
+            builds_by_dest: defaultdict[tuple[int, int], set[int | None]] = defaultdict(set)
 
+            # Moves are decoded JSON, so exact type checks suffice (and skip bools).
             for m in legal:
-                if not isinstance(m, dict) or m.get("t") != "move":
+                if type(m) is not dict:
                     continue
-                w = m.get("w")
-                to = m.get("to")
-                build = m.get("build")
-                if not (isinstance(w, int) and w in (0, 1) and isinstance(to, int)):
+                get = m.get
+                t = get("t")
+                if t == "place":
+                    # Only an exact {"t", "to": [a, b]} move equals the one a click builds.
+                    to = get("to")
+                    if len(m) == 2 and type(to) is list and len(to) == 2 and type(to[0]) is int and type(to[1]) is int:
+                        place_map[(to[0], to[1])] = m
                     continue
-                if build is not None and not isinstance(build, int):
+                if t != "move":
                     continue
-
-                key = (int(w), int(to), (None if build is None else int(build)))
-                self._ss_move_map[key] = m
-                self._ss_dests_by_worker[int(w)].add(int(to))
-                bd_key = (int(w), int(to))
-                if bd_key not in self._ss_builds_by_worker_dest:
-                    self._ss_builds_by_worker_dest[bd_key] = set()
-                self._ss_builds_by_worker_dest[bd_key].add(None if build is None else int(build))
+                w, to, build = get("w"), get("to"), get("build")
+                if not (type(w) is int and type(to) is int and (w == 0 or w == 1) and (build is None or type(build) is int)):
+                    continue
+                move_map[(w, to, build)] = m
+                if 0 <= to < 25:
+                    dest_masks[w] |= 1 << to
+                builds_by_dest[(w, to)].add(build)
+
+            self._ss_move_map = move_map
+            self._ss_place_map = place_map
+            self._ss_dest_masks = dest_masks
+            self._ss_builds_by_worker_dest = builds_by_dest
+            self._ss_indexed_for = legal
+
+        def _ttt_legal_cells(self, legal: list[JSONValue]) -> frozenset[int]:
+            hints = self._ttt_hints
+            if hints is None or hints[0] is not legal:
+                hints = self._ttt_hints = (legal, frozenset(x for x in legal if type(x) is int))
+            return hints[1]
+
+        def _ss_is_dest(self, worker_idx: int, cell: int) -> bool:
+            return 0 <= worker_idx < 2 and 0 <= cell < 25 and bool(self._ss_dest_masks[worker_idx] >> cell & 1)
 
     app = ArenaApp()
     app.mainloop()
@@ -0,0 +1,52 @@
+"""JSON encode/decode helpers that use orjson when it is installed.
+
+orjson is optional (``pip install -e ".[fast]"``); without it everything falls
+back to the stdlib ``json`` module with equivalent output.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+
+if orjson is not None:
+    _LINE_OPTS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+    _PRETTY_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> bytes:
+        """Compact UTF-8 JSON."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def dumps_line(obj: Any) -> bytes:
+        """Compact UTF-8 JSON followed by a newline (one JSONL record)."""
+        return orjson.dumps(obj, option=_LINE_OPTS)
+
+    def dumps_pretty(obj: Any, *, sort_keys: bool = False) -> bytes:
+        """Indented UTF-8 JSON followed by a newline (log files); keys keep insertion order unless sorted."""
+        return orjson.dumps(obj, option=(_PRETTY_OPTS | orjson.OPT_SORT_KEYS) if sort_keys else _PRETTY_OPTS)
+
+    loads = orjson.loads
+    JSONDecodeError: type[ValueError] = orjson.JSONDecodeError
+
+else:
+
+    def dumps(obj: Any) -> bytes:
+        """Compact UTF-8 JSON."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def dumps_line(obj: Any) -> bytes:
+        """Compact UTF-8 JSON followed by a newline (one JSONL record)."""
+        return dumps(obj) + b"\n"
+
+    def dumps_pretty(obj: Any, *, sort_keys: bool = False) -> bytes:
+        """Indented UTF-8 JSON followed by a newline (log files); keys keep insertion order unless sorted."""
+        return (json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=sort_keys) + "\n").encode("utf-8")
+
+    loads = json.loads
+    JSONDecodeError = json.JSONDecodeError
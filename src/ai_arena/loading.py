@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import importlib.util
 import sys
 from dataclasses import dataclass
@@ -33,20 +34,44 @@ def parse_load_spec(spec: str) -> LoadSpec:
     return LoadSpec(path=path, symbol=symbol)
 
 
-def load_module_from_path(path: Path, *, module_name_hint: str = "ai_arena_dynamic") -> ModuleType:
-    module_name = f"{module_name_hint}_{abs(hash(str(path)))}"
+# (module name, file mtime_ns) -> module executed from that version of the file.
+_MODULE_CACHE: dict[tuple[str, int], ModuleType] = {}
+
+
+def load_module_from_path(
+    path: Path, *, module_name_hint: str = "ai_arena_dynamic", fresh: bool = False
+) -> ModuleType:
+    """
+    Execute the file at `path` as a module.
+
+    Repeat loads of an unchanged file return the module from the first load;
+    a file modified since then is executed again. `fresh=True` always executes
+    the file and leaves the cache untouched.
+    """
+    # A digest of the path, unlike hash(), names the module the same in every process.
+    module_name = f"{module_name_hint}_{hashlib.blake2b(str(path).encode(), digest_size=8).hexdigest()}"
+    key = (module_name, path.stat().st_mtime_ns)
+    cached = None if fresh else _MODULE_CACHE.get(key)
+    if cached is not None:
+        return cached
     spec = importlib.util.spec_from_file_location(module_name, str(path))
     if spec is None or spec.loader is None:
         raise ImportError(f"Could not load module from: {path}")
     module = importlib.util.module_from_spec(spec)
     sys.modules[module_name] = module
     spec.loader.exec_module(module)
+    if not fresh:
+        _MODULE_CACHE[key] = module
     return module
 
 
-def load_symbol(spec: str) -> Any:
+def load_symbol(spec: str, *, fresh: bool = False) -> Any:
+    """
+    Resolve "<path>:<symbol>". Pass `fresh=True` to re-execute the module, e.g.
+    to get a new copy of a module-level agent instance.
+    """
     s = parse_load_spec(spec)
-    module = load_module_from_path(s.path)
+    module = load_module_from_path(s.path, fresh=fresh)
     try:
         return getattr(module, s.symbol)
     except AttributeError as e:
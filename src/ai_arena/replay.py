@@ -47,18 +47,23 @@ def replay_from_move_history(game: Game, move_history: list[dict[str, Any]]) ->
             )
         )
 
-    states: list[JSONValue] = [game.initial_state()]
+    # Every state is kept (the GUI scrubs through them), so each move needs the
+    # copying apply_move; the terminal check runs once, on the final state.
+    apply_move = game.apply_move
+    state = game.initial_state()
+    states: list[JSONValue] = [state]
     for m in moves:
         if m.note is None:
-            states.append(game.apply_move(states[-1], m.player, m.move))
+            state = apply_move(state, m.player, m.move)
+            states.append(state)
             continue
 
         # Engine convention: a non-None note indicates the move was not applied
         # (illegal_move / timeout / agent_error). Keep state unchanged and stop.
-        states.append(states[-1])
+        states.append(state)
         break
 
-    terminal = game.terminal(states[-1])
+    terminal = game.terminal(state)
     return Replay(game=game.name, moves=moves, states=states, terminal=terminal)
 
 
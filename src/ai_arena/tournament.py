@@ -1,18 +1,25 @@
 from __future__ import annotations
 
 import argparse
-import json
+import functools
+import itertools
+import multiprocessing
+import os
 import shlex
 import time
-import tomllib
-from dataclasses import asdict, dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
 
-from .engine import MatchResult, play_match
-from .games.tictactoe import TicTacToe
 from .loading import load_symbol
 
+if TYPE_CHECKING:
+    from .engine import MatchResult
+
+# The engine, built-in games and tomllib are imported where they are used so
+# that registering the tournament subcommand keeps CLI startup cheap.
+
 
 @dataclass(frozen=True, slots=True)
 class Competitor:
@@ -39,9 +46,31 @@ class TournamentResult:
     matches: list[MatchSummary]
     scoreboard: dict[str, dict[str, int]]
 
+    def to_json(self) -> dict[str, Any]:
+        """JSON-ready dict with the same shape dataclasses.asdict() produced."""
+        return {
+            "started_ts_ms": self.started_ts_ms,
+            "duration_ms": self.duration_ms,
+            "matches": [
+                {
+                    "context": m.context,
+                    "game": m.game,
+                    "p0": m.p0,
+                    "p1": m.p1,
+                    "winner": m.winner,
+                    "reason": m.reason,
+                    "turns": m.turns,
+                }
+                for m in self.matches
+            ],
+            "scoreboard": {cid: dict(row) for cid, row in self.scoreboard.items()},
+        }
+
 
 def _builtin_game_factory(name: str) -> Callable[[], Any] | None:
     if name == "tictactoe":
+        from .games.tictactoe import TicTacToe
+
         return TicTacToe
     return None
 
@@ -76,15 +105,13 @@ def _agent_factory(spec: str) -> Callable[[], Any]:
     obj = load_symbol(spec)
     if callable(obj):
         return obj  # type: ignore[return-value]
-    return lambda: obj
+    # A module-level agent instance: re-execute the module per call so each
+    # match gets its own object (agents are closed when their match ends).
+    return lambda: load_symbol(spec, fresh=True)
 
 
 def _pairings(xs: list[Competitor]) -> list[tuple[Competitor, Competitor]]:
-    out: list[tuple[Competitor, Competitor]] = []
-    for i in range(len(xs)):
-        for j in range(i + 1, len(xs)):
-            out.append((xs[i], xs[j]))
-    return out
+    return list(itertools.combinations(xs, 2))
 
 
 def _scoreboard_init(competitors: list[Competitor]) -> dict[str, dict[str, int]]:
@@ -93,16 +120,15 @@ def _scoreboard_init(competitors: list[Competitor]) -> dict[str, dict[str, int]]
 
 def _apply_result(sb: dict[str, dict[str, int]], p0: str, p1: str, winner: str | None) -> None:
     if winner is None:
-        sb[p0]["draws"] += 1
-        sb[p1]["draws"] += 1
-        sb[p0]["points"] += 1
-        sb[p1]["points"] += 1
+        for row in (sb[p0], sb[p1]):
+            row["draws"] += 1
+            row["points"] += 1
         return
 
-    loser = p1 if winner == p0 else p0
-    sb[winner]["wins"] += 1
-    sb[loser]["losses"] += 1
-    sb[winner]["points"] += 3
+    won = sb[winner]
+    won["wins"] += 1
+    won["points"] += 3
+    sb[p1 if winner == p0 else p0]["losses"] += 1
 
 
 def _maybe_close(agent: Any) -> None:
@@ -111,95 +137,157 @@ def _maybe_close(agent: Any) -> None:
         close()
 
 
-def run_tournament(
-    *,
+@dataclass(frozen=True, slots=True)
+class _ScheduledMatch:
+    """One match to play; only picklable specs so it can run in a worker process."""
+
+    context: str
+    game: str
+    p0: Competitor
+    p1: Competitor
+    log_path: Path | None
+    prime_pause: bool
+
+
+# Resolved once per process (skips re-parsing specs and re-statting module files).
+_cached_game_factory = functools.cache(_game_factory)
+_cached_agent_factory = functools.cache(_agent_factory)
+
+
+@functools.cache
+def _shared_game(spec: str) -> Any | None:
+    """The one instance every match of a `stateless` game can use, else None."""
+    game = _cached_game_factory(spec)()
+    return game if getattr(game, "stateless", False) is True else None
+
+
+def _play_scheduled(m: _ScheduledMatch) -> MatchSummary:
+    from .engine import play_match
+
+    game = _shared_game(m.game)
+    if game is None:
+        game = _cached_game_factory(m.game)()
+    agent0 = _cached_agent_factory(m.p0.agent)()
+    agent1 = _cached_agent_factory(m.p1.agent)()
+    try:
+        res: MatchResult = play_match(
+            game,
+            agent0,
+            agent1,
+            prime_pause=m.prime_pause,
+            log_path=m.log_path,
+        )
+    finally:
+        _maybe_close(agent0)
+        _maybe_close(agent1)
+
+    winner_id = None if res.winner is None else (m.p0.id if res.winner == 0 else m.p1.id)
+    return MatchSummary(
+        context=m.context,
+        game=res.game,
+        p0=m.p0.id,
+        p1=m.p1.id,
+        winner=winner_id,
+        reason=res.reason,
+        turns=res.turns,
+    )
+
+
+def _schedule(
     competitors: list[Competitor],
     neutral_game: str,
     rounds: int,
     swap_starts: bool,
     prime_pause: bool,
     log_dir: Path | None,
-) -> TournamentResult:
-    started = time.time()
-    started_ts_ms = int(started * 1000)
-
-    sb = _scoreboard_init(competitors)
-    matches: list[MatchSummary] = []
-
-    # Build a map of competitor home games for "away" matches
-    home_games = {c.id: c.home_game for c in competitors}
-    neutral_game_factory = _game_factory(neutral_game)
-
+) -> list[_ScheduledMatch]:
+    scheduled: list[_ScheduledMatch] = []
     for a, b in _pairings(competitors):
         # Matches per pairing: a-home, b-home, + third competitor's home (or neutral fallback).
         others = [c for c in competitors if c.id not in (a.id, b.id)]
         if others:
             third = others[0]
             third_ctx = "away:" + third.id
-            third_factory = _game_factory(third.home_game)
+            third_game = third.home_game
             third_p0 = min(a.id, b.id)
         else:
             third_ctx = "neutral"
-            third_factory = neutral_game_factory
+            third_game = neutral_game
             third_p0 = min(a.id, b.id)
 
         scenarios = [
-            ("home:" + a.id, _game_factory(a.home_game), a.id),
-            ("home:" + b.id, _game_factory(b.home_game), b.id),
-            (third_ctx, third_factory, third_p0),
+            ("home:" + a.id, a.home_game, a.id),
+            ("home:" + b.id, b.home_game, b.id),
+            (third_ctx, third_game, third_p0),
         ]
 
-        for context, game_factory, p0_default in scenarios:
+        pair_dir = log_dir / f"{a.id}_vs_{b.id}" if log_dir else None
+        for context, game_spec, p0_default in scenarios:
+            # Seat orders (p0 first) depend only on the scenario, not the round.
+            first = a if a.id == p0_default else b
+            seats = [(first, b if first is a else a)]
+            if swap_starts:
+                seats.append((seats[0][1], seats[0][0]))
+            safe_ctx = context.replace(":", "_")
+
             for r in range(rounds):
-                seats = [(p0_default, a.id if p0_default == b.id else b.id)]
-                if swap_starts:
-                    seats.append((seats[0][1], seats[0][0]))
-
-                for p0_id, p1_id in seats:
-                    game = game_factory()
-                    p0 = a if a.id == p0_id else b
-                    p1 = b if p0 is a else a
-
-                    agent0 = _agent_factory(p0.agent)()
-                    agent1 = _agent_factory(p1.agent)()
-
-                    log_path = None
-                    if log_dir:
-                        safe_ctx = context.replace(":", "_")
-                        log_path = (log_dir / f"{a.id}_vs_{b.id}" / f"{safe_ctx}_r{r}_{p0_id}_starts.json")
-
-                    try:
-                        res: MatchResult = play_match(
-                            game,
-                            agent0,
-                            agent1,
-                            prime_pause=prime_pause,
-                            log_path=log_path,
-                        )
-                    finally:
-                        _maybe_close(agent0)
-                        _maybe_close(agent1)
-
-                    winner_id = None if res.winner is None else (p0_id if res.winner == 0 else p1_id)
-                    summary = MatchSummary(
-                        context=context,
-                        game=res.game,
-                        p0=p0_id,
-                        p1=p1_id,
-                        winner=winner_id,
-                        reason=res.reason,
-                        turns=res.turns,
-                    )
-                    matches.append(summary)
-                    _apply_result(sb, p0_id, p1_id, winner_id)
-
-                    # Live match result output
-                    w = winner_id or "DRAW"
-                    print(
-                        f"  match {len(matches):>2}: [{context}] {p0_id} vs {p1_id}"
-                        f"  ->  {w} ({res.reason}, {res.turns}t)",
-                        flush=True,
-                    )
+                for p0, p1 in seats:
+                    log_path = pair_dir / f"{safe_ctx}_r{r}_{p0.id}_starts.json" if pair_dir else None
+                    scheduled.append(_ScheduledMatch(context, game_spec, p0, p1, log_path, prime_pause))
+    return scheduled
+
+
+def run_tournament(
+    *,
+    competitors: list[Competitor],
+    neutral_game: str,
+    rounds: int,
+    swap_starts: bool,
+    prime_pause: bool,
+    log_dir: Path | None,
+    workers: int = 1,
+) -> TournamentResult:
+    """
+    Play the round robin. With workers > 1 matches run in a process pool
+    (results are still reported and scored in schedule order).
+    """
+    if workers > 1 and prime_pause:
+        raise ValueError("prime_pause waits on stdin and cannot be combined with workers > 1")
+
+    started = time.time()
+    started_ts_ms = int(started * 1000)
+
+    sb = _scoreboard_init(competitors)
+    matches: list[MatchSummary] = []
+
+    # Fail fast on bad specs before any match (or worker) starts; this also
+    # does every import up front for the sequential path.
+    for spec in {neutral_game, *(c.home_game for c in competitors)}:
+        _cached_game_factory(spec)
+    for spec in {c.agent for c in competitors}:
+        _cached_agent_factory(spec)
+    scheduled = _schedule(competitors, neutral_game, rounds, swap_starts, prime_pause, log_dir)
+
+    pool = None
+    if workers > 1 and len(scheduled) > 1:
+        # spawn, not fork: the parent may already run agent reader threads.
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        results = pool.map(_play_scheduled, scheduled) if pool else map(_play_scheduled, scheduled)
+        for summary in results:
+            matches.append(summary)
+            _apply_result(sb, summary.p0, summary.p1, summary.winner)
+
+            # Live match result output
+            w = summary.winner or "DRAW"
+            print(
+                f"  match {len(matches):>2}: [{summary.context}] {summary.p0} vs {summary.p1}"
+                f"  ->  {w} ({summary.reason}, {summary.turns}t)",
+                flush=True,
+            )
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
 
     duration_ms = int((time.time() - started) * 1000)
     return TournamentResult(
@@ -211,6 +299,8 @@ def run_tournament(
 
 
 def _load_config(path: Path) -> dict[str, Any]:
+    import tomllib
+
     data = tomllib.loads(path.read_text(encoding="utf-8"))
     if not isinstance(data, dict):
         raise ValueError("Config must be a TOML table")
@@ -241,6 +331,9 @@ def cmd_tournament(args: argparse.Namespace) -> int:
     rounds = int(cfg.get("rounds", 1))
     swap_starts = bool(cfg.get("swap_starts", False))
     prime_pause = bool(cfg.get("prime_pause", False))
+    workers = args.workers if args.workers is not None else int(cfg.get("workers", 1))
+    if workers <= 0:
+        workers = os.cpu_count() or 1
 
     log_dir = None
     if cfg.get("log_dir"):
@@ -253,16 +346,18 @@ def cmd_tournament(args: argparse.Namespace) -> int:
         swap_starts=swap_starts,
         prime_pause=prime_pause,
         log_dir=log_dir,
+        workers=workers,
     )
 
-    print("scoreboard:")
-    for cid, row in sorted(result.scoreboard.items(), key=lambda kv: (-kv[1]["points"], kv[0])):
-        print(f"  {cid}: {row}")
+    ranked = sorted(result.scoreboard.items(), key=lambda kv: (-kv[1]["points"], kv[0]))
+    print("\n".join(["scoreboard:", *(f"  {cid}: {row}" for cid, row in ranked)]))
 
     if args.out:
+        from . import jsonio
+
         out_path = Path(args.out).expanduser().resolve()
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_text(json.dumps(asdict(result), indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        out_path.write_bytes(jsonio.dumps_pretty(result.to_json(), sort_keys=True))
         print(f"out: {out_path}")
 
     return 0
@@ -272,5 +367,11 @@ def load_tournament_parser(sub: argparse._SubParsersAction) -> None:
     p = sub.add_parser("tournament", help="Run the PvPvP round robin from a TOML config")
     p.add_argument("--config", default="arena.toml", help="Path to config TOML")
     p.add_argument("--out", help="Write JSON results to this path")
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Matches to run in parallel processes (0 = one per CPU; default: config 'workers' or 1)",
+    )
     p.set_defaults(func=cmd_tournament)
 
@@ -58,3 +58,102 @@ def test_agent_error_forfeits() -> None:
     r = play_match(game, ExplodingAgent(), FirstLegalAgent())
     assert r.reason == "agent_error"
     assert r.winner == 1
+
+
+def test_match_log_is_json_with_every_move(tmp_path) -> None:
+    import json
+
+    game = TicTacToe()
+
+    class FirstLegalAgent:
+        name = "first"
+
+        def select_move(self, game, state, player, legal_moves):
+            return legal_moves[0]
+
+    log_path = tmp_path / "logs" / "match.json"
+    r = play_match(game, FirstLegalAgent(), FirstLegalAgent(), log_path=log_path)
+    payload = json.loads(log_path.read_text(encoding="utf-8"))
+    assert payload["game"] == "tictactoe"
+    assert payload["result"]["reason"] == r.reason
+    assert payload["result"]["turns"] == r.turns
+    assert [m["move"] for m in payload["result"]["move_history"]] == [m.move for m in r.move_history]
+    assert payload["final_render"] == game.render(payload["final_state"])
+
+
+def test_match_log_left_absent_when_match_raises(tmp_path) -> None:
+    import pytest
+
+    class BrokenTicTacToe(TicTacToe):
+        def render(self, state):
+            raise RuntimeError("render failed")
+
+    class FirstLegalAgent:
+        name = "first"
+
+        def select_move(self, game, state, player, legal_moves):
+            return legal_moves[0]
+
+    log_path = tmp_path / "match.json"
+    with pytest.raises(RuntimeError):
+        play_match(BrokenTicTacToe(), FirstLegalAgent(), FirstLegalAgent(), log_path=log_path)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_prime_sieve_matches_trial_division() -> None:
+    from ai_arena.engine import _prime_sieve
+
+    sieve = _prime_sieve(200)
+    expected = [n for n in range(201) if n > 1 and all(n % d for d in range(2, int(n**0.5) + 1))]
+    assert [n for n in range(201) if sieve[n]] == expected
+    assert _prime_sieve(0) == b"\x00" and _prime_sieve(1) == b"\x00\x00"
+
+
+def test_move_history_reads_as_move_records() -> None:
+    from ai_arena.engine import MoveRecord
+
+    r = play_match(TicTacToe(), IllegalAgent(), IllegalAgent())
+    assert len(r.move_history) == 1
+    assert list(r.move_history) == [MoveRecord(turn=1, player=0, move=999, ms=r.move_history[0].ms, note="illegal_move")]
+    assert r.move_history[-1:] == [r.move_history[0]]
+
+
+def test_agents_receive_compact_state() -> None:
+    class HistoryTicTacToe(TicTacToe):
+        def initial_state(self):
+            return {"board": [0] * 9, "history": []}
+
+        def apply_move(self, state, player, move):
+            s2 = super().apply_move(state, player, move)
+            s2["history"] = state["history"] + [move]
+            return s2
+
+        def compact_state(self, state):
+            return {"board": state["board"]}
+
+    seen: list[dict] = []
+
+    class RecordingAgent:
+        name = "recording"
+
+        def select_move(self, game, state, player, legal_moves):
+            seen.append(state)
+            return legal_moves[0]
+
+    r = play_match(HistoryTicTacToe(), RecordingAgent(), RecordingAgent())
+    assert r.turns == len(seen) > 0
+    assert all(set(s) == {"board"} for s in seen)
+
+
+def test_states_seen_by_agents_are_not_mutated_later() -> None:
+    seen: list[tuple[dict, list[int]]] = []
+
+    class KeepingAgent:
+        name = "keeping"
+
+        def select_move(self, game, state, player, legal_moves):
+            seen.append((state, list(state["board"])))
+            return legal_moves[0]
+
+    play_match(TicTacToe(), KeepingAgent(), KeepingAgent())
+    assert seen and all(state["board"] == board for state, board in seen)
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from ai_arena.loading import load_symbol
+
+
+def test_load_symbol_reuses_module_until_file_changes(tmp_path: Path) -> None:
+    mod = tmp_path / "mod.py"
+    mod.write_text("MARKER = object()\nVALUE = 1\n")
+
+    marker = load_symbol(f"{mod}:MARKER")
+    assert load_symbol(f"{mod}:VALUE") == 1
+    assert load_symbol(f"{mod}:MARKER") is marker  # not re-executed
+
+    mod.write_text("VALUE = 2\n")
+    st = mod.stat()
+    os.utime(mod, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert load_symbol(f"{mod}:VALUE") == 2
+
+
+def test_load_symbol_fresh_re_executes_module(tmp_path: Path) -> None:
+    mod = tmp_path / "inst.py"
+    mod.write_text("AGENT = object()\n")
+
+    cached = load_symbol(f"{mod}:AGENT")
+    fresh = load_symbol(f"{mod}:AGENT", fresh=True)
+    assert fresh is not cached
+    assert load_symbol(f"{mod}:AGENT") is cached  # fresh loads leave the cache alone
@@ -25,6 +25,15 @@ def test_skysummit_placement_legal_moves_count() -> None:
     assert len(moves) == 600
 
 
+def test_skysummit_placement_moves_are_not_shared() -> None:
+    g = _game()
+    s = g.initial_state()
+    first = g.legal_moves(s, 0)[0]
+    expected = dict(first, to=list(first["to"]))
+    first["to"].reverse()
+    assert g.legal_moves(g.initial_state(), 0)[0] == expected
+
+
 def test_skysummit_place_then_play_transition() -> None:
     g = _game()
     s = g.initial_state()
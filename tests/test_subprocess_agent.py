@@ -3,6 +3,8 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 from ai_arena.agents.subprocess_agent import SubprocessAgent
 from ai_arena.games.tictactoe import TicTacToe
 
@@ -37,3 +39,70 @@ def test_subprocess_agent_select_move(tmp_path: Path) -> None:
     finally:
         agent.close()
 
+
+def test_subprocess_agent_times_out(tmp_path: Path) -> None:
+    bot = tmp_path / "silent_bot.py"
+    bot.write_text("import sys\nfor line in sys.stdin:\n    pass\n", encoding="utf-8")
+
+    agent = SubprocessAgent(command=[sys.executable, "-u", str(bot)], timeout_s=0.2)
+    try:
+        game = TicTacToe()
+        state = game.initial_state()
+        with pytest.raises(TimeoutError):
+            agent.select_move(game, state, 0, game.legal_moves(state, 0))
+    finally:
+        agent.close()
+
+
+def test_subprocess_agent_skips_debug_lines_in_one_write(tmp_path: Path) -> None:
+    bot = tmp_path / "chatty_bot.py"
+    bot.write_text(
+        "\n".join(
+            [
+                "import json, sys",
+                "for line in sys.stdin:",
+                "    legal = json.loads(line)['legal_moves']",
+                "    out = 'debug text\\n' + json.dumps({'type':'log','x':'y'*100000}) + '\\n'",
+                "    sys.stdout.write(out + json.dumps({'type':'move','move':legal[-1]}) + '\\n')",
+                "    sys.stdout.flush()",
+            ]
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+
+    agent = SubprocessAgent(command=[sys.executable, "-u", str(bot)], timeout_s=5.0)
+    try:
+        game = TicTacToe()
+        state = game.initial_state()
+        for _ in range(2):
+            legal = game.legal_moves(state, 0)
+            move = agent.select_move(game, state, 0, legal)
+            assert move == legal[-1]
+            state = game.apply_move(state, 0, move)
+    finally:
+        agent.close()
+
+
+def test_subprocess_agents_share_reader(tmp_path: Path) -> None:
+    bot = tmp_path / "last_bot.py"
+    bot.write_text(
+        "import json, sys\n"
+        "for line in sys.stdin:\n"
+        "    print(json.dumps({'type':'move','move':json.loads(line)['legal_moves'][-1]}), flush=True)\n",
+        encoding="utf-8",
+    )
+
+    agents = [SubprocessAgent(command=[sys.executable, "-u", str(bot)], timeout_s=5.0) for _ in range(3)]
+    try:
+        game = TicTacToe()
+        state = game.initial_state()
+        for turn in range(6):
+            player = turn % 2
+            legal = game.legal_moves(state, player)
+            move = agents[turn % 3].select_move(game, state, player, legal)
+            assert move == legal[-1]
+            state = game.apply_move(state, player, move)
+    finally:
+        for a in agents:
+            a.close()
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import pytest
+
+from ai_arena.games.tictactoe import TicTacToe
+
+
+def _state(cells: str) -> dict:
+    return {"board": [".XO".index(ch) for ch in cells]}
+
+
+def test_initial_state_has_all_moves() -> None:
+    game = TicTacToe()
+    s = game.initial_state()
+    assert game.legal_moves(s, 0) == list(range(9))
+    assert not game.terminal(s).is_terminal
+
+
+def test_legal_moves_skip_occupied_cells() -> None:
+    game = TicTacToe()
+    assert game.legal_moves(_state("X.O.X...O"), 1) == [1, 3, 5, 6, 7]
+
+
+@pytest.mark.parametrize(
+    "cells,winner",
+    [
+        ("XXX.OO...", 0),
+        ("X..X..X.O", 0),
+        ("OX.XO.X.O", 1),
+        ("XXO.O.O.X", 1),
+    ],
+)
+def test_terminal_detects_wins(cells: str, winner: int) -> None:
+    t = TicTacToe().terminal(_state(cells))
+    assert t.is_terminal and t.reason == "win" and t.winner == winner
+
+
+def test_terminal_detects_draw() -> None:
+    t = TicTacToe().terminal(_state("XOXXOOOXX"))
+    assert t.is_terminal and t.reason == "draw" and t.winner is None
+
+
+def test_apply_move_rejects_occupied_cell() -> None:
+    game = TicTacToe()
+    s = game.apply_move(game.initial_state(), 0, 4)
+    assert s == _state("....X....")
+    with pytest.raises(ValueError):
+        game.apply_move(s, 1, 4)
+
+
+def test_step_info_matches_separate_calls() -> None:
+    game = TicTacToe()
+    for cells in (".........", "X.O.X...O", "XXX.OO...", "XOXXOOOXX"):
+        s = _state(cells)
+        assert game.step_info(s, 0) == (game.terminal(s), game.legal_moves(s, 0))
+
+
+def test_is_legal_matches_legal_moves() -> None:
+    game = TicTacToe()
+    s = _state("X.O.X...O")
+    legal = game.legal_moves(s, 1)
+    for move in (*range(-1, 10), "4", None, [1]):
+        assert game.is_legal(s, 1, move) == (move in legal)
+
+
+def test_render_draws_rows() -> None:
+    assert TicTacToe().render(_state("X.O.X...O")) == "X . O\n. X .\n. . O"
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from ai_arena.tournament import Competitor, run_tournament
+
+
+def test_parallel_tournament_matches_sequential_schedule() -> None:
+    competitors = [Competitor(id=i, home_game="tictactoe", agent="random") for i in ("a", "b", "c")]
+    kwargs = dict(
+        competitors=competitors,
+        neutral_game="tictactoe",
+        rounds=1,
+        swap_starts=True,
+        prime_pause=False,
+        log_dir=None,
+    )
+
+    seq = run_tournament(**kwargs)
+    par = run_tournament(**kwargs, workers=2)
+
+    assert [(m.context, m.p0, m.p1) for m in par.matches] == [(m.context, m.p0, m.p1) for m in seq.matches]
+    assert len(par.matches) == 3 * 3 * 2
+    played = sum(row["wins"] + row["losses"] + row["draws"] for row in par.scoreboard.values())
+    assert played == 2 * len(par.matches)
+
+
+def test_stateless_game_instance_is_shared_across_matches() -> None:
+    from ai_arena.tournament import _shared_game
+
+    game = _shared_game("tictactoe")
+    assert game is not None and _shared_game("tictactoe") is game
+
+
+def test_agent_instance_spec_is_fresh_per_match(tmp_path) -> None:
+    bot = tmp_path / "bot.py"
+    bot.write_text(
+        "class Bot:\n"
+        "    name = 'bot'\n"
+        "    closed = False\n"
+        "    def select_move(self, game, state, player, legal_moves):\n"
+        "        assert not self.closed, 'reused a closed agent'\n"
+        "        return legal_moves[0]\n"
+        "    def close(self):\n"
+        "        self.closed = True\n"
+        "AGENT = Bot()\n"
+    )
+    competitors = [
+        Competitor(id="a", home_game="tictactoe", agent=f"{bot}:AGENT"),
+        Competitor(id="b", home_game="tictactoe", agent="random"),
+    ]
+
+    result = run_tournament(
+        competitors=competitors,
+        neutral_game="tictactoe",
+        rounds=2,
+        swap_starts=False,
+        prime_pause=False,
+        log_dir=None,
+    )
+
+    assert all(m.reason != "agent_error" for m in result.matches)